@@ -0,0 +1,164 @@
+"""
+Benchmark the converter on synthetic schemas.
+
+Run with `python -m benchmarks.run --save` to record a baseline on this
+machine, then `python -m benchmarks.run` to compare against it. The command
+fails when a scenario got slower or uses more memory than the tolerance allows.
+"""
+
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+
+import click
+
+from benchmarks import schemas
+from jsonschema_restructuredtext import generate
+
+DEFAULT_BASELINE = Path(__file__).parent / ".baseline.json"
+
+# The schema factory and the generate() options of each scenario
+SCENARIOS = {
+    "wide-object": (schemas.wide_object, {}),
+    "deep-nesting": (schemas.deep_nesting, {}),
+    "ref-fanout": (schemas.ref_fanout, {}),
+    "ref-fanout-resolved": (schemas.ref_fanout, {"replace_refs": True}),
+    "large-enum": (schemas.large_enum, {}),
+    "any-of-union": (schemas.any_of_union, {}),
+}
+
+# The measurements compared against the baseline
+METRICS = ("seconds", "peak_memory")
+
+
+def measure(schema: dict, options: dict, repeat: int = 5) -> dict:
+    """
+    Measure the fastest of `repeat` conversions, and the memory of one: its
+    peak, and the number of blocks it retains once it returns, those of the
+    output and of anything the conversion leaves behind. The retained blocks
+    are reported, not compared against the baseline.
+    """
+    seconds = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        rst = generate(schema, **options)
+        seconds.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        rst = generate(schema, **options)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": min(seconds),
+        "peak_memory": peak_memory,
+        "retained_blocks": sum(stat.count for stat in snapshot.statistics("filename")),
+        "output_size": len(rst),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    List the measurements that exceed their baseline by more than `tolerance`.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric in METRICS:
+            limit = baseline[name][metric] * (1 + tolerance)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.6g} exceeds the baseline "
+                    f"{baseline[name][metric]:.6g} by more than {tolerance:.0%}"
+                )
+    return regressions
+
+
+@click.command()
+@click.option(
+    "-k",
+    "--scenario",
+    "names",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS)),
+    help="Run only this scenario, can be given several times.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Number of timed conversions of each scenario.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_BASELINE,
+    show_default=True,
+    help="File with the baseline results.",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.25,
+    show_default=True,
+    help="Allowed relative increase of each measurement over the baseline.",
+)
+@click.option(
+    "--save/--no-save",
+    default=False,
+    show_default=True,
+    help="Save the results as the new baseline instead of comparing them.",
+)
+def main(names, repeat, baseline, tolerance, save):
+    """
+    Benchmark the conversion of synthetic schemas.
+    """
+
+    results = {}
+    for name in names or SCENARIOS:
+        factory, options = SCENARIOS[name]
+        result = results[name] = measure(factory(), options, repeat)
+        click.echo(
+            f"{name:<20} {result['seconds'] * 1000:9.1f} ms "
+            f"{result['peak_memory'] / 1024 / 1024:9.1f} MiB peak "
+            f"{result['retained_blocks']:>8} blocks retained "
+            f"{result['output_size']:>10} chars"
+        )
+
+    if save:
+        baseline.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": results}, indent=2
+            )
+        )
+        click.echo(f"Saved the baseline to {baseline}")
+        return
+
+    if not baseline.exists():
+        click.echo("No baseline to compare with, run with --save to record one.")
+        return
+
+    regressions = compare(
+        results, json.loads(baseline.read_text())["results"], tolerance
+    )
+    for regression in regressions:
+        click.echo(regression, err=True)
+    if regressions:
+        raise SystemExit(1)
+    click.echo("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
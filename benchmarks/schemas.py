@@ -0,0 +1,128 @@
+"""
+Generators of synthetic schemas stressing one aspect of the converter each.
+"""
+
+TYPES = ["string", "integer", "number", "boolean"]
+
+
+def _property(i: int) -> dict:
+    """
+    A documented scalar property with the keywords the converter formats.
+    """
+    prop = {
+        "type": TYPES[i % len(TYPES)],
+        "title": f"Property {i}",
+        "description": f"The `value` of property {i}, see `the docs`.",
+    }
+    if prop["type"] == "string":
+        prop["pattern"] = f"^[a-z]{{{i % 10 + 1}}}$"
+        prop["examples"] = [f"value{i}"]
+        prop["default"] = f"value{i}"
+    elif prop["type"] in ("integer", "number"):
+        prop["minimum"] = 0
+        prop["exclusiveMaximum"] = i + 100
+    return prop
+
+
+def wide_object(properties: int = 5000) -> dict:
+    """
+    A single object with many properties, half of them required.
+    """
+    return {
+        "title": "Wide object",
+        "type": "object",
+        "properties": {f"property{i}": _property(i) for i in range(properties)},
+        "required": [f"property{i}" for i in range(0, properties, 2)],
+    }
+
+
+def deep_nesting(depth: int = 300, width: int = 3) -> dict:
+    """
+    Objects nested `depth` levels deep, each with a few scalar properties.
+    """
+    node = {"type": "object", "properties": {}}
+    schema = {"title": "Deep nesting", **node}
+    for level in range(depth):
+        child = {"type": "object", "description": f"Level {level}.", "properties": {}}
+        for i in range(width):
+            node["properties"][f"field{i}"] = _property(i)
+        node["properties"][f"level{level}"] = child
+        node = child
+    return schema
+
+
+def ref_fanout(definitions: int = 500, references: int = 20) -> dict:
+    """
+    Definitions referencing many other definitions.
+    """
+    defs = {}
+    for i in range(definitions):
+        properties = {"id": _property(i)}
+        for j in range(1, references + 1):
+            target = (i + j) % definitions
+            properties[f"ref{j}"] = {"$ref": f"#/$defs/Definition{target}"}
+        properties["list"] = {
+            "type": "array",
+            "items": {"$ref": f"#/$defs/Definition{(i + 1) % definitions}"},
+        }
+        defs[f"Definition{i}"] = {
+            "title": f"Definition {i}",
+            "description": f"Definition number {i}.",
+            "type": "object",
+            "properties": properties,
+        }
+
+    return {
+        "title": "Reference fan-out",
+        "type": "object",
+        "properties": {
+            f"root{i}": {"$ref": f"#/$defs/Definition{i}"}
+            for i in range(0, definitions, 10)
+        },
+        "$defs": defs,
+    }
+
+
+def large_enum(values: int = 10000, properties: int = 30) -> dict:
+    """
+    Properties with large `enum` lists.
+    """
+    return {
+        "title": "Large enums",
+        "type": "object",
+        "properties": {
+            f"choice{i}": {
+                "type": "string",
+                "description": f"One of many values {i}.",
+                "enum": [f"value{i}-{j}" for j in range(values)],
+            }
+            for i in range(properties)
+        },
+    }
+
+
+def any_of_union(variants: int = 200, properties: int = 200) -> dict:
+    """
+    Properties with wide `anyOf` unions of definitions and scalar types.
+    """
+    defs = {
+        f"Variant{i}": {
+            "title": f"Variant {i}",
+            "description": f"Variant number {i}.",
+            "type": "object",
+            "properties": {"value": _property(i)},
+        }
+        for i in range(variants)
+    }
+    union = [{"$ref": f"#/$defs/Variant{i}"} for i in range(variants)]
+    union += [{"type": t} for t in TYPES] + [{"type": "null"}]
+
+    return {
+        "title": "anyOf unions",
+        "type": "object",
+        "properties": {
+            f"union{i}": {"description": f"Union {i}.", "anyOf": union}
+            for i in range(properties)
+        },
+        "$defs": defs,
+    }
@@ -0,0 +1,110 @@
+"""
+Benchmark the import time of the package and of the command line interface.
+
+Run with `python -m benchmarks.startup`. The command fails when a module takes
+longer to import than its budget, or when importing it loads one of the
+dependencies that are only needed once something is converted.
+"""
+
+import subprocess
+import sys
+
+import click
+
+# The import time budget of each module, in seconds
+BUDGETS = {
+    "jsonschema_restructuredtext": 0.05,
+    "jsonschema_restructuredtext.main": 0.15,
+}
+
+# Modules that importing the package or the CLI must not load
+DEFERRED = (
+    "loguru",
+    "yaml",
+    "importlib.metadata",
+    "concurrent.futures.process",
+    "jsonschema_restructuredtext.converter.rst",
+)
+
+
+def import_time(module: str, repeat: int = 5) -> float:
+    """
+    Measure the fastest of `repeat` imports of a module in a new interpreter,
+    with `python -X importtime`.
+    """
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # The last line is the module itself: "import time: self | cumulative | name"
+        cumulative = result.stderr.strip().splitlines()[-1].split("|")[1]
+        times.append(int(cumulative) / 1_000_000)
+    return min(times)
+
+
+def loaded_modules(module: str) -> list:
+    """
+    List the deferred modules loaded by importing a module in a new interpreter.
+    """
+    code = (
+        f"import sys, {module}\n"
+        f"print('\\n'.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def check(times: dict) -> list:
+    """
+    List the modules whose import time exceeds their budget, or that load
+    deferred modules.
+    """
+    problems = []
+    for module, seconds in times.items():
+        budget = BUDGETS[module]
+        if seconds > budget:
+            problems.append(
+                f"{module}: import takes {seconds * 1000:.1f} ms, "
+                f"the budget is {budget * 1000:.0f} ms"
+            )
+        for loaded in loaded_modules(module):
+            problems.append(f"{module}: importing it loads {loaded}")
+    return problems
+
+
+@click.command()
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Number of timed imports of each module.",
+)
+def main(repeat):
+    """
+    Benchmark the import time of the package and the CLI against their budget.
+    """
+
+    times = {}
+    for module, budget in BUDGETS.items():
+        seconds = times[module] = import_time(module, repeat)
+        click.echo(
+            f"{module:<36} {seconds * 1000:7.1f} ms (budget {budget * 1000:.0f} ms)"
+        )
+
+    problems = check(times)
+    for problem in problems:
+        click.echo(problem, err=True)
+    if problems:
+        raise SystemExit(1)
+    click.echo("Within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,62 @@
-from jsonschema_restructuredtext.converter.rst import generate
+import importlib
+from typing import TYPE_CHECKING
 
-generate = generate
+# The module of each public name. They are imported on first access, so that
+# importing the package, or the CLI for `--help`, does not load the converter
+# and its dependencies.
+_EXPORTS = {
+    "Converter": "jsonschema_restructuredtext.converter.rst",
+    "agenerate_many": "jsonschema_restructuredtext.aio",
+    "compile_schema": "jsonschema_restructuredtext.converter.rst",
+    "generate": "jsonschema_restructuredtext.converter.rst",
+    "generate_async": "jsonschema_restructuredtext.aio",
+    "generate_async_iter": "jsonschema_restructuredtext.aio",
+    "generate_files": "jsonschema_restructuredtext.converter.rst",
+    "generate_iter": "jsonschema_restructuredtext.converter.rst",
+    "generate_nodes": "jsonschema_restructuredtext.converter.doctree",
+    "generate_to": "jsonschema_restructuredtext.converter.rst",
+    "render_plan": "jsonschema_restructuredtext.converter.rst",
+    "render_plan_nodes": "jsonschema_restructuredtext.converter.doctree",
+    "RenderPlan": "jsonschema_restructuredtext.plan",
+    "RenderStats": "jsonschema_restructuredtext.stats",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from jsonschema_restructuredtext.aio import (
+        agenerate_many as agenerate_many,
+        generate_async as generate_async,
+        generate_async_iter as generate_async_iter,
+    )
+    from jsonschema_restructuredtext.converter.doctree import (
+        generate_nodes as generate_nodes,
+        render_plan_nodes as render_plan_nodes,
+    )
+    from jsonschema_restructuredtext.converter.rst import (
+        Converter as Converter,
+        compile_schema as compile_schema,
+        generate as generate,
+        generate_files as generate_files,
+        generate_iter as generate_iter,
+        generate_to as generate_to,
+        render_plan as render_plan,
+    )
+    from jsonschema_restructuredtext.plan import RenderPlan as RenderPlan
+    from jsonschema_restructuredtext.stats import RenderStats as RenderStats
@@ -0,0 +1,210 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Union
+
+from jsonschema_restructuredtext.converter.rst import Converter
+
+# Characters of output rendered by each call to the executor
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Schemas rendered at the same time by agenerate_many()
+DEFAULT_CONCURRENCY = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def default_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool shared by the asynchronous functions, created on first
+    use with as many threads as CPUs, up to 4.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="jsonschema-restructuredtext",
+            )
+        return _executor
+
+
+async def generate_async_iter(
+    schema: dict,
+    title: Optional[str] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    converter: Optional[Converter] = None,
+    **kwargs,
+) -> AsyncIterator[str]:
+    """
+    Generate reStructuredText for a given JSON schema as an asynchronous
+    sequence of chunks of about `chunk_size` characters.
+
+    Each chunk is rendered by a separate call to `executor`, a thread pool,
+    the shared `default_executor()` if not given, so the event loop is never
+    blocked. The rendering is resumed from one chunk to the next, so it cannot
+    run in a process pool. It holds the GIL while it runs, a converter with
+    more than one worker renders the definitions in processes instead.
+    The chunks of several schemas rendered at the same time are interleaved
+    in the executor, so a large schema does not keep the others waiting, and
+    the next chunk is only rendered once the previous one is consumed. When
+    the iterator is closed or the task consuming it is cancelled, the
+    rendering stops after the current chunk.
+
+    Uses `converter`, or a converter created from the keyword arguments.
+    Joining the chunks gives the same string `generate` returns.
+    """
+    _check_executor(executor)
+    converter = _converter(converter, kwargs)
+    async for chunk in _render_iter(converter, schema, title, executor, chunk_size):
+        yield chunk
+
+
+async def generate_async(
+    schema: dict,
+    title: Optional[str] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+    converter: Optional[Converter] = None,
+    **kwargs,
+) -> str:
+    """
+    Generate a reStructuredText string from a given JSON schema, rendered in
+    the thread pool `executor` without blocking the event loop.
+
+    Uses `converter`, or a converter created from the keyword arguments. See
+    `generate_async_iter`.
+    """
+    chunks = generate_async_iter(schema, title, executor, converter=converter, **kwargs)
+    return "".join([chunk async for chunk in chunks])
+
+
+async def agenerate_many(
+    schemas: Union[Iterable[dict], AsyncIterable[dict]],
+    title: Optional[str] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    converter: Optional[Converter] = None,
+    **kwargs,
+) -> AsyncIterator[tuple]:
+    """
+    Generate the reStructuredText of many schemas, at most `concurrency` at a
+    time in the thread pool `executor`, with `converter` or one converter
+    created from the keyword arguments.
+
+    Yields `(index, rst)` tuples as the schemas are rendered, `index` being the
+    position of the schema in `schemas`, so a large schema does not hold back
+    the ones after it. The next schemas are only taken from `schemas` while
+    the results are consumed. Closing the iterator, or cancelling the task
+    consuming it, stops the schemas being rendered.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    _check_executor(executor)
+
+    converter = _converter(converter, kwargs)
+    source = _aiter(schemas)
+
+    async def render(index: int, schema: dict) -> tuple:
+        chunks = _render_iter(converter, schema, title, executor)
+        return index, "".join([chunk async for chunk in chunks])
+
+    pending = set()
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    schema = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(render(index, schema)))
+                index += 1
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _render_iter(
+    converter: Converter,
+    schema: dict,
+    title: Optional[str] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    executor = executor or default_executor()
+    iterator = converter.generate_iter(schema, title)
+
+    future = None
+    try:
+        while True:
+            future = executor.submit(_next_chunk, iterator, chunk_size)
+            chunk = await asyncio.wrap_future(future, loop=loop)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        if future is not None and not future.done():
+            # The generator cannot be closed while it runs in the executor
+            future.add_done_callback(lambda _: iterator.close())
+        else:
+            iterator.close()
+
+
+def _check_executor(executor: Optional[ThreadPoolExecutor]) -> None:
+    """
+    Reject executors other than thread pools, the generator rendering a schema
+    cannot be sent to another process.
+    """
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise TypeError(
+            f"The executor must be a ThreadPoolExecutor, not {type(executor).__name__}"
+        )
+
+
+def _converter(converter: Optional[Converter], kwargs: dict) -> Converter:
+    if converter is None:
+        return Converter(**kwargs)
+    if kwargs:
+        raise TypeError("Options cannot be given with a converter")
+    return converter
+
+
+def _next_chunk(iterator: Iterator[str], chunk_size: int) -> Optional[str]:
+    """
+    Join the next chunks of an iterator up to `chunk_size` characters, `None`
+    once it is exhausted.
+    """
+    chunks = []
+    size = 0
+    for chunk in iterator:
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            break
+    return "".join(chunks) if chunks else None
+
+
+async def _aiter(items: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
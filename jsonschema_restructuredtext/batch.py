@@ -0,0 +1,266 @@
+import glob
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple, Optional
+
+from jsonschema_restructuredtext.loaders import LOADERS, check_schema, load_schema
+from jsonschema_restructuredtext.stats import RenderStats
+from jsonschema_restructuredtext.utils import atomic_open
+
+if TYPE_CHECKING:
+    from jsonschema_restructuredtext.converter.rst import Converter
+
+SCHEMA_SUFFIXES = tuple(LOADERS)
+DEFAULT_OUTPUT_TEMPLATE = "{stem}.rst"
+
+# The fields replaced in the output template and in the title of each file
+OUTPUT_TEMPLATE_FIELDS = ("stem", "name")
+TITLE_FIELDS = ("stem",)
+
+
+class SchemaFile(NamedTuple):
+    """
+    A schema file to convert, with its path relative to the input it was found in.
+    """
+
+    path: Path
+    relative_path: Path
+
+
+class ConversionResult(NamedTuple):
+    """
+    The outcome of converting one schema file.
+    """
+
+    source: Path
+    destination: Path
+    seconds: float
+    cache_hits: int = 0
+    cache_misses: int = 0
+    stats: Optional[RenderStats] = None
+    # Why the file could not be converted, by `convert_files`
+    error: Optional[str] = None
+
+
+def find_schema_files(inputs: Iterable[str]) -> list:
+    """
+    Expand files, directories and glob patterns into a list of schema files.
+
+    Directories are searched recursively for files with a schema suffix. Files
+    found more than once are only returned the first time.
+    """
+
+    found = []
+    seen = set()
+
+    for pattern in inputs:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+
+        for match in matches:
+            path = Path(match)
+            if path.is_dir():
+                files = [
+                    SchemaFile(file, file.relative_to(path))
+                    for file in sorted(path.rglob("*"))
+                    if file.suffix.lower() in SCHEMA_SUFFIXES and file.is_file()
+                ]
+            else:
+                files = [SchemaFile(path, Path(path.name))]
+
+            for file in files:
+                key = os.path.realpath(file.path)
+                if key not in seen:
+                    seen.add(key)
+                    found.append(file)
+
+    return found
+
+
+def check_template(template: str, fields: Iterable[str]) -> None:
+    """
+    Check that a template can be formatted with the given fields.
+
+    Raises `ValueError` if it has another field or a stray brace.
+    """
+    fields = tuple(fields)
+    try:
+        template.format(**dict.fromkeys(fields, ""))
+    except (KeyError, IndexError, AttributeError, ValueError) as e:
+        allowed = ", ".join(f"'{{{field}}}'" for field in fields)
+        raise ValueError(
+            f"Invalid template {template!r}, the allowed fields are {allowed}."
+        ) from e
+
+
+def schema_title(schema_file: SchemaFile, title: Optional[str] = None) -> str:
+    """
+    Get the title of a schema file, formatted with the `stem` of the file.
+    """
+    return (title or "{stem}").format(stem=schema_file.path.stem)
+
+
+def output_path(
+    schema_file: SchemaFile,
+    output_dir: Path,
+    template: str = DEFAULT_OUTPUT_TEMPLATE,
+) -> Path:
+    """
+    Get the output path of a schema file.
+
+    The template is formatted with the `stem` and `name` of the schema file and
+    placed in `output_dir`, keeping the directory structure below the input.
+    """
+    relative = schema_file.relative_path
+    filename = template.format(stem=relative.stem, name=relative.name)
+    return Path(output_dir) / relative.parent / filename
+
+
+def convert_file(
+    converter: "Converter",
+    source: Path,
+    destination: Path,
+    title: Optional[str] = None,
+    schema: Optional[dict] = None,
+    stats: Optional[RenderStats] = None,
+    split: bool = False,
+) -> ConversionResult:
+    """
+    Convert a schema file and write the reStructuredText to `destination`.
+
+    `schema` is the already loaded content of `source`, if any. The output is
+    written atomically, so `destination` never holds a partial document. With
+    `split`, each definition is written to its own file, see
+    `Converter.generate_files`. The time spent loading and converting the file
+    is added to `stats` when given.
+
+    Raises `ValueError` if the file is not a schema, and `OSError` if it
+    cannot be read or written.
+    """
+
+    start = time.perf_counter()
+    cache = converter.cache
+    cache_hits, cache_misses = (cache.hits, cache.misses) if cache else (0, 0)
+
+    if schema is None:
+        if stats is None:
+            schema = load_schema(source)
+        else:
+            with stats.phase("load"):
+                schema = load_schema(source)
+    check_schema(schema)
+
+    if split:
+        converter.generate_files(schema, destination, title, stats)
+    else:
+        _write_document(converter, schema, destination, title, stats)
+
+    if cache:
+        cache_hits, cache_misses = cache.hits - cache_hits, cache.misses - cache_misses
+
+    return ConversionResult(
+        source,
+        destination,
+        time.perf_counter() - start,
+        cache_hits,
+        cache_misses,
+        stats,
+    )
+
+
+def _write_document(
+    converter: "Converter",
+    schema: dict,
+    destination: Path,
+    title: Optional[str],
+    stats: Optional[RenderStats],
+) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_open(destination) as f:
+        converter.generate_to(schema, f, title, stats)
+
+
+def convert_files(
+    converter: "Converter",
+    schema_files: Iterable[SchemaFile],
+    output_dir: Path,
+    template: str = DEFAULT_OUTPUT_TEMPLATE,
+    title: Optional[str] = None,
+    workers: int = 1,
+    profile: bool = False,
+    split: bool = False,
+) -> Iterator[ConversionResult]:
+    """
+    Convert schema files with one converter, yielding the result of each file.
+
+    The title is formatted with the `stem` of each file, and defaults to the
+    stem itself. It is only used for schemas without a title of their own.
+
+    With more than one worker, the files are spread over a process pool where
+    each process has an equivalent converter. Results are yielded in order.
+    With `profile`, each result holds the `RenderStats` of its file. With
+    `split`, each definition is written to its own file.
+
+    Files that cannot be converted do not stop the others, their result has
+    the `error` that prevented it.
+    """
+    jobs = [
+        (
+            schema_file.path,
+            output_path(schema_file, output_dir, template),
+            schema_title(schema_file, title),
+            profile,
+            split,
+        )
+        for schema_file in schema_files
+    ]
+
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield _convert_job(converter, job)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(converter.options(),),
+    )
+    try:
+        yield from executor.map(_convert_file_in_worker, jobs)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+# The converter of a pool worker
+_worker_converter = None
+
+
+def _init_batch_worker(options: dict) -> None:
+    global _worker_converter
+
+    from jsonschema_restructuredtext.converter.rst import Converter
+
+    _worker_converter = Converter(**options)
+
+
+def _convert_file_in_worker(job: tuple) -> ConversionResult:
+    return _convert_job(_worker_converter, job)
+
+
+def _convert_job(converter: "Converter", job: tuple) -> ConversionResult:
+    source, destination, title, profile, split = job
+    stats = RenderStats() if profile else None
+    start = time.perf_counter()
+    try:
+        return convert_file(
+            converter, source, destination, title, stats=stats, split=split
+        )
+    except (OSError, ValueError) as e:
+        return ConversionResult(
+            source, destination, time.perf_counter() - start, error=str(e)
+        )
@@ -0,0 +1,236 @@
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from jsonschema_restructuredtext.utils import atomic_open, to_json
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def package_version() -> str:
+    """
+    Get the installed version of the package, part of every cache key.
+    """
+    # Imported on first use, it is slow to import and only needed with a cache
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("jsonschema-restructuredtext")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def cache_key(*parts) -> Optional[str]:
+    """
+    Get a stable hash of JSON-like parts, `None` if they cannot be serialized.
+    """
+    try:
+        data = json.dumps(
+            parts,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=to_json,
+        )
+    except (TypeError, ValueError, RecursionError):
+        # Not JSON data, a cyclic structure, or nested too deeply
+        return None
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def function_name(function) -> Optional[str]:
+    """
+    Get the importable name of a function, to identify it in cache keys.
+
+    `None` for lambdas, nested functions and callables without a qualified
+    name, such as partial functions or instances of classes.
+    """
+    qualname = getattr(function, "__qualname__", None)
+    module = getattr(function, "__module__", None)
+    if not isinstance(qualname, str) or "<" in qualname or module is None:
+        return None
+    return f"{module}.{qualname}"
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered reStructuredText, keyed by content hash.
+
+    Entries are written atomically, so several processes can share a cache
+    directory. When the entries take more than `max_size` bytes, the least
+    recently used ones are removed.
+    """
+
+    def __init__(self, directory, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._size = None
+
+    def __getstate__(self) -> dict:
+        # Each process keeps its own counters and size estimate
+        return {"directory": self.directory, "max_size": self.max_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["directory"], state["max_size"])
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the entry of `key`, `None` if it is not cached.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                value = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Mark the entry as recently used
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store `value` as the entry of `key`.
+        """
+        for _ in self.tee(key, [value]):
+            pass
+
+    def tee(self, key: str, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield the chunks while writing them to the entry of `key`.
+
+        The entry is only stored once all the chunks have been consumed.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with atomic_open(path, newline="") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry_size for _, entry_size, _ in self._entries())
+            else:
+                self._size += path.stat().st_size
+
+            if self._size > self.max_size:
+                self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.rst"
+
+    def _entries(self) -> list:
+        """
+        List the last use, size and path of the entries, oldest first.
+        """
+        entries = []
+        for entry in self.directory.glob("*/*.rst"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        return sorted(entries)
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries, down to 90% of the maximum size.
+        """
+        entries = self._entries()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry in entries:
+            if size <= self.max_size * 0.9:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                entry.unlink()
+            size -= entry_size
+
+        self._size = size
+
+
+class MemoryCache:
+    """
+    In-memory cache of rendered reStructuredText, with the interface of
+    `RenderCache`.
+
+    When the entries take more than `max_size` characters, the least recently
+    used ones are removed. Each process has its own entries.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def __getstate__(self) -> dict:
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["max_size"])
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the entry of `key`, `None` if it is not cached.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store `value` as the entry of `key`.
+        """
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = value
+            self._size += len(value)
+
+            while self._size > self.max_size and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def tee(self, key: str, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield the chunks while collecting them into the entry of `key`.
+
+        The entry is only stored once all the chunks have been consumed.
+        """
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self.set(key, "".join(parts))
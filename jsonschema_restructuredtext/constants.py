@@ -1,2 +1,9 @@
 # Define default section level punctuation
 DEFAULT_SECTION_PUNCTUATION = ["=", "-", "^", "~", '+', '*', '+', '.']
+
+# Criteria the properties of a table can be sorted by, source order without any
+PROPERTY_ORDERS = ["required", "deprecated", "alphabetical"]
+
+# Default address of the render server
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
@@ -0,0 +1,255 @@
+import re
+from types import SimpleNamespace
+from typing import Optional
+
+from docutils import nodes
+from docutils.frontend import get_default_settings
+from docutils.parsers.rst import Parser
+from docutils.parsers.rst.languages import get_language
+from docutils.parsers.rst.states import Inliner
+from docutils.utils import new_document
+
+from jsonschema_restructuredtext.converter.rst import Converter
+from jsonschema_restructuredtext.plan import PropertyRow, RenderPlan, Section, Table
+from jsonschema_restructuredtext.utils import dashify
+
+# Cross-references written by the compiler in formatted values, resolved to
+# the anchors of the document without Sphinx
+REF_PATTERN = re.compile(r":ref:`([^`<]*?)\s*<([^`<>]+)>`")
+
+# Descriptions with lists, literal blocks, directives, indentation or section
+# underlines, which are parsed as reStructuredText instead of as paragraphs
+BLOCK_MARKUP_PATTERN = re.compile(
+    r"^(?:\s|[-*+•] |\d+[.)] |#[.)] |\.\. |([=\-~^+*#`'\":.])\1{2,}\s*$)|::\s*$",
+    re.MULTILINE,
+)
+
+COLUMNS = ("Property", "Type", "Required", "Description")
+
+
+def generate_nodes(
+    schema: dict,
+    document: Optional[nodes.document] = None,
+    title: Optional[str] = None,
+    **kwargs,
+) -> list:
+    """
+    Generate docutils nodes for a given JSON schema.
+
+    Accepts the same keyword arguments as `generate`. See `render_plan_nodes`.
+    """
+    plan = Converter(**kwargs).compile(schema, title)
+    return render_plan_nodes(plan, document)
+
+
+def render_plan_nodes(
+    plan: RenderPlan, document: Optional[nodes.document] = None
+) -> list:
+    """
+    Render a compiled plan as docutils nodes, without writing and parsing
+    reStructuredText for its structure.
+
+    Gives the content of the string `render_plan` returns, its sections,
+    tables, field lists, targets and references built directly, with the
+    tables of nested properties indented in block quotes. Only the text of
+    descriptions and formatted values is parsed, for its inline markup. The
+    anchors are registered as explicit targets of `document`, the document
+    the nodes are inserted into, so that Sphinx can reference them. A
+    standalone document is created if not given.
+    """
+    return _NodeBuilder(document).plan(plan)
+
+
+class _NodeBuilder:
+    """
+    Build the nodes of a plan, registering their targets in a document.
+    """
+
+    def __init__(self, document: Optional[nodes.document]) -> None:
+        if document is None:
+            document = new_document("<jsonschema>", get_default_settings(Parser))
+        self.document = document
+
+        self.inliner = Inliner()
+        self.inliner.init_customizations(document.settings)
+        self.memo = SimpleNamespace(
+            document=document,
+            reporter=document.reporter,
+            language=get_language(document.settings.language_code),
+        )
+
+    def plan(self, plan: RenderPlan) -> list:
+        root, *definitions = plan.sections
+        node = self.section(root)
+        # The definitions are subsections of the root, as their headings are
+        for definition in definitions:
+            node += self.section(definition)
+        return [node]
+
+    def section(self, section: Section) -> nodes.section:
+        node = nodes.section()
+        self.target(node, section.anchor)
+        node += nodes.title(section.heading, section.heading)
+        node.extend(self.blocks(section.description))
+        node += self.paragraph(f"Type: `{section.type}`")
+        node.extend(self.table(section.table))
+        return node
+
+    def table(self, table: Table) -> list:
+        if table.text is not None:
+            return [self.paragraph(table.text.strip())]
+
+        result = []
+        if table.closed:
+            result.append(
+                nodes.block_quote(
+                    "", self.paragraph("⚠️ Additional properties are not allowed.")
+                )
+            )
+
+        if not table.rows:
+            return result
+
+        result.append(self.property_table(table))
+
+        breadcrumb = []
+        for item in table.json_path:
+            breadcrumb.append(self.reference(item, dashify(item)))
+            breadcrumb.append(nodes.Text(" > "))
+
+        for row in table.rows:
+            result.append(nodes.transition())
+            result.extend(self.detail(row, breadcrumb))
+        return result
+
+    def property_table(self, table: Table) -> nodes.table:
+        group = nodes.tgroup(cols=len(COLUMNS))
+        for _ in COLUMNS:
+            group += nodes.colspec(colwidth=100 // len(COLUMNS))
+        group += nodes.thead(
+            "", self.row([nodes.paragraph(column, column) for column in COLUMNS])
+        )
+
+        body = nodes.tbody()
+        for row in table.rows:
+            body += self.row(
+                [
+                    nodes.paragraph("", "", self.reference(row.name, row.anchor)),
+                    self.paragraph(row.type),
+                    self.paragraph(row.required),
+                    self.paragraph(row.summary),
+                ]
+            )
+        group += body
+
+        node = nodes.table()
+        if table.title:
+            node += nodes.title(table.title, *self.inline(table.title))
+        node += group
+        return node
+
+    def row(self, paragraphs: list) -> nodes.row:
+        row = nodes.row()
+        for paragraph in paragraphs:
+            # Empty cells have no paragraph, as in parsed tables
+            row += nodes.entry("", paragraph) if paragraph.children else nodes.entry()
+        return row
+
+    def detail(self, row: PropertyRow, breadcrumb: list) -> list:
+        detail = row.detail
+        heading = nodes.paragraph()
+        self.target(heading, row.anchor)
+        heading.extend(node.deepcopy() for node in breadcrumb)
+        heading += nodes.strong(row.name, row.name)
+        result = [heading]
+
+        if detail.description:
+            result.extend(self.blocks(detail.description))
+
+        fields = nodes.field_list()
+        fields += self.field("Type", row.type)
+        fields += self.field("Required", row.required)
+        if detail.deprecated:
+            fields += self.field("Deprecated", "Yes")
+        if detail.default is not None:
+            fields += self.field("Default", f"`{detail.default}`")
+        if detail.possible_values:
+            fields += self.field("Possible Values", detail.possible_values)
+        if detail.examples:
+            fields += self.field("Examples", detail.examples)
+        result.append(fields)
+
+        if detail.reference:
+            label, anchor = detail.reference
+            see = nodes.paragraph("", "See ", self.reference(label, anchor))
+            see += nodes.Text(".")
+            result.append(nodes.block_quote("", see))
+        elif detail.depth_limit is not None:
+            result.append(
+                nodes.block_quote(
+                    "",
+                    nodes.paragraph(
+                        text="Nested properties are not shown, the maximum "
+                        f"depth of {detail.depth_limit} is reached."
+                    ),
+                )
+            )
+        elif detail.nested is not None:
+            nested = self.table(detail.nested)
+            if nested:
+                result.append(nodes.block_quote("", *nested))
+        return result
+
+    def field(self, name: str, value: str) -> nodes.field:
+        return nodes.field(
+            "",
+            nodes.field_name(name, name),
+            nodes.field_body("", self.paragraph(value)),
+        )
+
+    def target(self, node: nodes.Element, anchor: str) -> None:
+        """
+        Make `node` the target of `anchor`, as a `.. _anchor:` label before it.
+        """
+        node["names"].append(nodes.fully_normalize_name(anchor))
+        self.document.note_explicit_target(node, node)
+
+    def reference(self, text: str, anchor: str) -> nodes.reference:
+        return nodes.reference(text, text, refid=nodes.make_id(anchor))
+
+    def paragraph(self, text: str) -> nodes.paragraph:
+        return nodes.paragraph(text, "", *self.inline(text))
+
+    def inline(self, text: str) -> list:
+        """
+        Parse the inline markup of a formatted value.
+        """
+        result = []
+        start = 0
+        for match in REF_PATTERN.finditer(text):
+            result.extend(self._parse_inline(text[start : match.start()]))
+            result.append(self.reference(match.group(1), match.group(2)))
+            start = match.end()
+        result.extend(self._parse_inline(text[start:]))
+        return result
+
+    def _parse_inline(self, text: str) -> list:
+        if not text:
+            return []
+        parsed, messages = self.inliner.parse(text, 0, self.memo, self.document)
+        return parsed + messages
+
+    def blocks(self, text: str) -> list:
+        """
+        Parse a description, as paragraphs unless it has block markup.
+        """
+        if BLOCK_MARKUP_PATTERN.search(text) is None:
+            return [
+                self.paragraph(paragraph)
+                for paragraph in re.split(r"\n\s*\n", text)
+                if paragraph.strip()
+            ]
+
+        fragment = new_document(self.document["source"], self.document.settings)
+        Parser().parse(text, fragment)
+        return fragment.children
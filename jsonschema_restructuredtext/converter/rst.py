@@ -1,47 +1,622 @@
 import contextlib
+import copyreg
+import functools
+import io
+import itertools
 import json
-import sys
+import pickle
+import threading
+import time
 import urllib.parse
-
-import yaml
-from loguru import logger
-
-from jsonschema_restructuredtext.constants import DEFAULT_SECTION_PUNCTUATION
+from collections import namedtuple
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TextIO, Union
+
+from jsonschema_restructuredtext.cache import (
+    MemoryCache,
+    RenderCache,
+    cache_key,
+    function_name,
+    package_version,
+)
+from jsonschema_restructuredtext.constants import (
+    DEFAULT_SECTION_PUNCTUATION,
+    PROPERTY_ORDERS,
+)
+from jsonschema_restructuredtext.plan import (
+    DetailBlock,
+    PropertyRow,
+    RenderPlan,
+    Section,
+    Table,
+)
+from jsonschema_restructuredtext.resolver import referenced_definitions, resolve_refs
+from jsonschema_restructuredtext.stats import RenderStats, timed
 
 from jsonschema_restructuredtext.utils import (
     create_section,
     create_const,
+    is_documented,
     create_enum,
     sort_properties,
     strip_inside_backticks,
     dashify,
+    to_json,
+    write_if_changed,
 )
 
-def _get_schema_header(
-    schema: dict,
-    ref_key: str,
-    description_fallback: str,
-    section_punctuation: list = DEFAULT_SECTION_PUNCTUATION,
-    schema_level: int = 0,
-) -> str:
+# Characters of definition names replaced in file names, that would make them
+# paths outside of their directory
+PATH_SEPARATORS = str.maketrans("/\\\0", "---")
+
+class _WithoutDebug:
+    """
+    A logger dropping the debug messages before they are formatted, and
+    passing the other messages to `logger`.
     """
-    Get the title and description of the schema.
 
-    If nested, all headings are increased by one level.
+    def __init__(self, logger) -> None:
+        self._logger = logger
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self._logger, name)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses"])
+
+
+class RenderContext:
+    """
+    State of a single conversion run.
     """
 
-    rst = ""
-    title = schema.get("title", ref_key)
+    def __init__(
+        self,
+        defs: dict,
+        section_punctuation: list,
+        logger,
+        max_depth: Optional[int] = None,
+        property_order: Sequence[str] = (),
+        documented: Optional[Callable[[dict], bool]] = None,
+    ) -> None:
+        self.defs = defs
+        self.section_punctuation = section_punctuation
+        self.logger = logger
+        self.max_depth = max_depth
+        self.property_order = property_order
+        # Properties it rejects are pruned with their subtree, when given
+        self.documented = documented
+        self.pruned = 0
+        # Measurements of the run, when profiling
+        self.stats: Optional[RenderStats] = None
+
+        # The label and anchor of the subschemas that have a section of their
+        # own and of the ones on the current path, keyed by identity. Reaching
+        # one of them again gives a cross-reference instead of a nested table.
+        self.anchors = {}
+        # Subschemas whose details are being computed, to break cycles
+        self.details_in_progress = set()
+
+        # The type and details of references, keyed by pointer, and of
+        # subschemas, keyed by identity. The schema outlives the run, so
+        # identities are not reused while the caches are alive.
+        self.ref_cache = {}
+        self.details_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cached(self, cache: dict, key, compute: Callable, *args):
+        """
+        Look up `key` in `cache`, calling `compute(*args)` to fill it on a miss.
+        """
+        try:
+            value = cache[key]
+        except KeyError:
+            self.cache_misses += 1
+            value = cache[key] = compute(*args)
+        else:
+            self.cache_hits += 1
+        return value
 
-    # Add the section and description of the schema
-    rst += create_section(section_punctuation[schema_level], dashify(ref_key), title)
-    description = schema.get("description", description_fallback).strip(" \n")
-    rst += description
-    rst += "\n\n"
 
-    rst += f"Type: `{schema.get('type', 'object(?)').strip()}`\n\n"
+class Converter:
+    """
+    Reusable converter from JSON schemas to reStructuredText.
 
-    return rst
+    Messages are logged with loguru, whose sinks are left to the application,
+    unless a logger is injected. The converter keeps no state between runs, so
+    it can be
+    shared between threads. The hits and misses of the per-run definition
+    caches are added up in `cache_info()`.
+
+    Schemas are never modified, so one schema can be rendered several times
+    without copying it, and read-only mappings such as `MappingProxyType` are
+    accepted.
+
+    Args:
+        title: The title of the reStructuredText document.
+        replace_refs: This feature is experimental. Whether to replace JSON references with their resolved values.
+        suppress_undocumented: Whether to skip definitions and properties without title, description, or examples.
+        section_punctuation: The punctuation used for each section level.
+        max_depth: The maximum nesting depth of property tables, unlimited if `None`.
+        property_order: The criteria to sort the properties of each table by, the
+            first one taking precedence: "required" first, "deprecated" last
+            or "alphabetical". Properties are in source order if empty.
+        documented: With `suppress_undocumented`, the predicate telling whether a
+            definition or property is documented, instead of `is_documented`.
+            Undocumented properties are skipped with everything nested in them,
+            before they are analysed. It is pickled with more than one worker.
+        debug: Whether to log debug messages, they are dropped otherwise.
+        logger: A loguru compatible logger to use instead of the global one.
+        workers: The number of processes rendering the definitions.
+        cache: A cache of rendered documents and definition sections, on disk or in memory.
+    """
+
+    def __init__(
+        self,
+        title: str = "JSON Schema",
+        replace_refs: bool = False,
+        suppress_undocumented: bool = False,
+        section_punctuation: list = DEFAULT_SECTION_PUNCTUATION,
+        max_depth: Optional[int] = None,
+        property_order: Sequence[str] = (),
+        documented: Callable[[dict], bool] = is_documented,
+        debug: bool = False,
+        logger=None,
+        workers: int = 1,
+        cache: Optional[Union[RenderCache, MemoryCache]] = None,
+    ) -> None:
+        self.title = title
+        self.replace_refs = replace_refs
+        self.suppress_undocumented = suppress_undocumented
+        self.section_punctuation = section_punctuation
+        self.max_depth = max_depth
+        self.property_order = tuple(property_order)
+        self.documented = documented
+        self.debug = debug
+        self.workers = workers
+        self.cache = cache
+
+        unknown = set(self.property_order) - set(PROPERTY_ORDERS)
+        if unknown:
+            raise ValueError(f"Unknown property order: {', '.join(sorted(unknown))}")
+
+        if logger is None:
+            import loguru
+
+            logger = loguru.logger if debug else _WithoutDebug(loguru.logger)
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def options(self) -> dict:
+        """
+        Return the arguments to create an equivalent converter in another process.
+        """
+        return {
+            "title": self.title,
+            "replace_refs": self.replace_refs,
+            "suppress_undocumented": self.suppress_undocumented,
+            "section_punctuation": self.section_punctuation,
+            "max_depth": self.max_depth,
+            "property_order": self.property_order,
+            "documented": self.documented,
+            "debug": self.debug,
+            "cache": self.cache,
+        }
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the hits and misses of the definition caches over all runs.
+        """
+        with self._lock:
+            return CacheInfo(self._cache_hits, self._cache_misses)
+
+    def generate(
+        self,
+        schema: dict,
+        title: Optional[str] = None,
+        stats: Optional[RenderStats] = None,
+    ) -> str:
+        """
+        Generate a reStructuredText string from a given JSON schema.
+        """
+        return "".join(self.generate_iter(schema, title, stats))
+
+    def generate_to(
+        self,
+        schema: dict,
+        fp: TextIO,
+        title: Optional[str] = None,
+        stats: Optional[RenderStats] = None,
+    ) -> None:
+        """
+        Write the reStructuredText for a given JSON schema to a text stream.
+        """
+        for chunk in self.generate_iter(schema, title, stats):
+            with _phase(stats, "write"):
+                fp.write(chunk)
+
+    def generate_iter(
+        self,
+        schema: dict,
+        title: Optional[str] = None,
+        stats: Optional[RenderStats] = None,
+    ) -> Iterator[str]:
+        """
+        Generate reStructuredText for a given JSON schema as a sequence of chunks.
+
+        Uses the title of the converter unless `title` is given. With more than
+        one worker, the definitions are rendered in a process pool, the output
+        is the same as with a single worker. With a cache, the document and the
+        section of each definition are only rendered when not already cached.
+        The time spent in each phase is added to `stats` when given.
+        """
+        chunks, _ = self._document_chunks(schema, title or self.title, stats)
+        yield from chunks
+
+    def generate_cached(
+        self,
+        schema: dict,
+        title: Optional[str] = None,
+        stats: Optional[RenderStats] = None,
+    ) -> tuple:
+        """
+        Generate a reStructuredText string from a given JSON schema.
+
+        Returns the string and whether it was served from the cache.
+        """
+        chunks, cached = self._document_chunks(schema, title or self.title, stats)
+        return "".join(chunks), cached
+
+    def _document_chunks(
+        self, schema: dict, title: str, stats: Optional[RenderStats]
+    ) -> tuple:
+        """
+        Look a document up in the cache, and get an iterator of its chunks and
+        whether it was found. The document is rendered as the chunks are
+        consumed otherwise.
+        """
+        document_key = definition_keys = None
+        if self.cache is not None:
+            with _phase(stats, "cache"):
+                document_key, definition_keys = self._cache_keys(schema, title)
+
+        if document_key is not None:
+            with _phase(stats, "cache"):
+                rst = self.cache.get(document_key)
+            if rst is not None:
+                if stats is not None:
+                    stats.count("cached_documents")
+                return iter((rst,)), True
+
+        chunks = self._render_document(
+            schema, title, document_key, definition_keys, stats
+        )
+        return chunks, False
+
+    def _render_document(
+        self,
+        schema: dict,
+        title: str,
+        document_key: Optional[str],
+        definition_keys: Optional[dict],
+        stats: Optional[RenderStats],
+    ) -> Iterator[str]:
+        ctx, sections = self._render_sections(schema, title, definition_keys, stats)
+
+        chunks = _strip_chunks(
+            itertools.chain.from_iterable(chunks for _, chunks in sections)
+        )
+        if stats is not None:
+            chunks = timed(chunks, functools.partial(stats.add, "render"))
+        if document_key is not None:
+            chunks = self.cache.tee(document_key, chunks)
+
+        try:
+            yield from chunks
+        finally:
+            self._finish_run(ctx, stats)
+
+    def generate_files(
+        self,
+        schema: dict,
+        destination: Union[str, Path],
+        title: Optional[str] = None,
+        stats: Optional[RenderStats] = None,
+    ) -> list:
+        """
+        Write the reStructuredText for a given JSON schema as an index file and
+        one file per definition.
+
+        The section of each definition is written to a file in the directory
+        named after the stem of `destination`, as soon as it is rendered. The
+        root section and a `toctree` of the definitions are written to
+        `destination` last. Cross-references between the files use the labels
+        of the sections.
+
+        Files are only replaced when their content changed, so Sphinx only
+        rebuilds the pages of the definitions that changed. Files of
+        definitions removed from the schema are not deleted.
+
+        Returns the paths of the files of the document, the index first.
+        """
+        title = title or self.title
+        destination = Path(destination)
+        if not destination.suffix:
+            raise ValueError(f"{destination}: the index file needs a suffix")
+        directory = destination.with_suffix("")
+
+        definition_keys = None
+        if self.cache is not None:
+            with _phase(stats, "cache"):
+                _, definition_keys = self._cache_keys(schema, title)
+
+        ctx, sections = self._render_sections(schema, title, definition_keys, stats)
+
+        root = None
+        paths = []
+        stems = set()
+        try:
+            for key, chunks in sections:
+                chunks = _strip_chunks(chunks)
+                if stats is not None:
+                    chunks = timed(chunks, functools.partial(stats.add, "render"))
+                # A page cannot start with a transition
+                rst = _drop_leading_transition("".join(chunks))
+
+                if key is None:
+                    root = rst
+                    continue
+
+                stem = _unique_stem(_file_stem(key), stems)
+                paths.append(directory / f"{stem}{destination.suffix}")
+                with _phase(stats, "write"):
+                    directory.mkdir(parents=True, exist_ok=True)
+                    write_if_changed(paths[-1], rst)
+
+            if paths:
+                root += "\n.. toctree::\n   :maxdepth: 1\n\n" + "".join(
+                    f"   {directory.name}/{path.stem}\n" for path in paths
+                )
+            with _phase(stats, "write"):
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                write_if_changed(destination, root)
+        finally:
+            self._finish_run(ctx, stats)
+
+        return [destination] + paths
+
+    def compile(
+        self,
+        schema: dict,
+        title: Optional[str] = None,
+        previous: Optional[RenderPlan] = None,
+    ) -> RenderPlan:
+        """
+        Compile a JSON schema into a plan of its sections, tables and rows.
+
+        The plan holds the analysed and formatted values, `render_plan()` only
+        assembles them. Sections of a `previous` plan compiled from the same
+        content with the same options are reused instead of analysed again.
+        """
+        title = title or self.title
+
+        document_key, definition_keys = self._cache_keys(schema, title)
+        reused = {}
+        if previous is not None:
+            reused = {
+                section.key: section
+                for section in previous.sections
+                if section.key is not None
+            }
+            if document_key is not None and document_key in reused:
+                return previous
+
+        if self.replace_refs:
+            schema = resolve_refs(schema)
+
+        ctx, definitions = self._start_run(schema, title)
+
+        sections = [_compile_root(schema, title, ctx, document_key)]
+        for key, definition in definitions:
+            section_key = definition_keys[key] if definition_keys else None
+            section = reused.get(section_key)
+            if section is None:
+                section = _compile_definition(key, definition, ctx, section_key)
+            sections.append(section)
+
+        return RenderPlan(title, sections)
+
+    def _render_sections(
+        self,
+        schema: dict,
+        title: str,
+        definition_keys: Optional[dict],
+        stats: Optional[RenderStats] = None,
+    ) -> tuple:
+        """
+        Start a run, and get its context and the sections of the document.
+
+        The sections are `(key, chunks)` tuples, with the unstripped chunks of
+        each section and `None` as the key of the root section. Definitions are
+        only rendered when their section is not in the cache, and stored in it
+        when `definition_keys` is given.
+        """
+        if self.replace_refs:
+            with _phase(stats, "resolve_refs"):
+                schema = resolve_refs(schema)
+
+        ctx, definitions = self._start_run(schema, title)
+        ctx.stats = stats
+
+        cached = {}
+        if definition_keys is not None:
+            with _phase(stats, "cache"):
+                for key, _ in definitions:
+                    rst = self.cache.get(definition_keys[key])
+                    if rst is not None:
+                        cached[key] = rst
+            if stats is not None:
+                stats.count("cached_definitions", len(cached))
+        to_render = [(key, d) for key, d in definitions if key not in cached]
+
+        if self.workers > 1 and len(to_render) > 1:
+            # Pickle the schema before anything is rendered, so the workers
+            # start from the same state as a serial run
+            payload = _dumps_run((self.options(), schema, title, stats is not None))
+            rendered = _render_definitions_in_pool(
+                payload, [key for key, _ in to_render], self.workers, ctx
+            )
+        else:
+            rendered = (_render_definition(key, d, ctx) for key, d in to_render)
+
+        sections = itertools.chain(
+            [(None, _render_root(schema, title, ctx))],
+            self._definition_sections(
+                definitions, cached, rendered, definition_keys, stats
+            ),
+        )
+        return ctx, sections
+
+    def _definition_sections(
+        self,
+        definitions: list,
+        cached: dict,
+        rendered: Iterator,
+        definition_keys: Optional[dict],
+        stats: Optional[RenderStats] = None,
+    ) -> Iterator[tuple]:
+        """
+        Yield the key and chunks of each definition section, in order, from the
+        cached sections or from the freshly rendered ones.
+
+        Rendered sections are stored in the cache when `definition_keys` is given.
+        """
+        for key, _ in definitions:
+            if key in cached:
+                yield key, (cached[key],)
+                continue
+
+            section = next(rendered)
+            if definition_keys is None:
+                yield key, section
+            else:
+                rst = "".join(section)
+                with _phase(stats, "cache"):
+                    self.cache.set(definition_keys[key], rst)
+                yield key, (rst,)
+
+    def _finish_run(self, ctx: RenderContext, stats: Optional[RenderStats]) -> None:
+        """
+        Report the hits and misses of the definition caches of a run.
+        """
+        self.logger.debug(
+            "Definition cache: {} hits, {} misses",
+            ctx.cache_hits,
+            ctx.cache_misses,
+        )
+        if ctx.documented is not None:
+            self.logger.debug("Pruned {} undocumented properties", ctx.pruned)
+        if stats is not None:
+            stats.count("details_cache_hits", ctx.cache_hits)
+            stats.count("details_cache_misses", ctx.cache_misses)
+        with self._lock:
+            self._cache_hits += ctx.cache_hits
+            self._cache_misses += ctx.cache_misses
+
+    def _document_key(self, schema: dict, title: str) -> tuple:
+        """
+        Get the prefix of every cache key, with the version and the options,
+        and the cache key of the document.
+
+        The key is `None` if the schema cannot be hashed, or if the
+        `documented` predicate has no importable name to identify it with.
+        """
+        options = self.options()
+        del options["debug"], options["cache"]
+
+        documented = options.pop("documented")
+        if self.suppress_undocumented:
+            name = function_name(documented)
+            if name is None:
+                return None, None
+            options["documented"] = name
+        prefix = (package_version(), options)
+
+        return prefix, cache_key(*prefix, title, schema)
+
+    def _cache_keys(self, schema: dict, title: str) -> tuple:
+        """
+        Get the cache keys of the document and of each definition section.
+
+        A section depends on its definition, on the definitions it references
+        and on whether these have a section of their own. When it references
+        anything else, it depends on the whole document. The keys are `None`
+        if the document has no key.
+        """
+        prefix, document_key = self._document_key(schema, title)
+        if document_key is None:
+            return None, None
+
+        defs = schema.get("definitions", schema.get("$defs", {}))
+        hashes = {key: cache_key(definition) for key, definition in defs.items()}
+        with_section = {
+            key for key, definition in defs.items() if self._has_section(definition)
+        }
+
+        definition_keys = {}
+        for key, definition in defs.items():
+            names = referenced_definitions(definition, defs)
+            if names is None:
+                dependencies = [title, document_key]
+            else:
+                dependencies = [
+                    [name, hashes[name], name in with_section] for name in sorted(names)
+                ]
+            definition_keys[key] = cache_key(*prefix, key, hashes[key], dependencies)
+
+        return document_key, definition_keys
+
+    def _has_section(self, definition: dict) -> bool:
+        """
+        Whether a definition gets a section of its own.
+        """
+        return not self.suppress_undocumented or self.documented(definition)
+
+    def _start_run(self, schema: dict, title: str) -> tuple:
+        """
+        Create the context of a run and select the definitions to render.
+        """
+        ctx = RenderContext(
+            schema.get("definitions", schema.get("$defs", {})),
+            self.section_punctuation,
+            self.logger,
+            self.max_depth,
+            self.property_order,
+            self.documented if self.suppress_undocumented else None,
+        )
+
+        definitions = [
+            (key, definition)
+            for key, definition in ctx.defs.items()
+            if self._has_section(definition)
+        ]
+
+        # Register the sections up front, so that nested occurrences of these
+        # subschemas link to their section instead of repeating it
+        ctx.anchors[id(schema)] = (title, dashify(title))
+        for key, definition in definitions:
+            ctx.anchors.setdefault(id(definition), (key, dashify(key)))
+
+        return ctx, definitions
 
 
 def generate(
@@ -50,7 +625,12 @@ def generate(
     replace_refs: bool = False,
     suppress_undocumented: bool = False,
     section_punctuation: list = DEFAULT_SECTION_PUNCTUATION,
+    max_depth: Optional[int] = None,
+    property_order: Sequence[str] = (),
+    documented: Callable[[dict], bool] = is_documented,
     debug: bool = False,
+    workers: int = 1,
+    stats: Optional[RenderStats] = None,
 ) -> str:
     """
     Generate a reStructuredText string from a given JSON schema.
@@ -59,127 +639,480 @@ def generate(
         schema: The JSON schema to generate reStructuredText from.
         title: The title of the reStructuredText document.
         replace_refs: This feature is experimental. Whether to replace JSON references with their resolved values.
-        debug: Whether to print debug messages.
+        max_depth: The maximum nesting depth of property tables, unlimited if `None`.
+        property_order: The criteria to sort the properties of each table by, source order if empty.
+        documented: The predicate telling whether a definition or property is documented, with `suppress_undocumented`.
+        debug: Whether to log debug messages.
+        workers: The number of processes rendering the definitions.
+        stats: Time and call counts of the conversion are added to it, when given.
 
     Returns:
         str: The generated reStructuredText string.
     """
-    # Set the log level
-    if debug:
-        logger.remove()
-        logger.add(sys.stderr, level="DEBUG")
-    else:
-        logger.remove()
-        logger.add(sys.stderr, level="INFO")
+    return Converter(
+        title=title,
+        replace_refs=replace_refs,
+        suppress_undocumented=suppress_undocumented,
+        section_punctuation=section_punctuation,
+        max_depth=max_depth,
+        property_order=property_order,
+        documented=documented,
+        debug=debug,
+        workers=workers,
+    ).generate(schema, stats=stats)
+
+
+def generate_to(schema: dict, fp: TextIO, **kwargs) -> None:
+    """
+    Write the reStructuredText for a given JSON schema to a text stream.
+
+    Accepts the same keyword arguments as `generate`. The document is written
+    chunk by chunk, so it is never held in memory as a whole.
+    """
+    stats = kwargs.pop("stats", None)
+    Converter(**kwargs).generate_to(schema, fp, stats=stats)
 
-    if replace_refs:
-        import jsonref
 
-        _schema: dict = jsonref.replace_refs(schema)  # type: ignore
-    else:
-        _schema = schema
+def generate_files(schema: dict, destination: Union[str, Path], **kwargs) -> list:
+    """
+    Write the reStructuredText for a given JSON schema as an index file at
+    `destination` and one file per definition.
+
+    Accepts the same keyword arguments as `generate`, see
+    `Converter.generate_files`.
+    """
+    stats = kwargs.pop("stats", None)
+    return Converter(**kwargs).generate_files(schema, destination, stats=stats)
 
-    rst = ""
 
-    # Add the title and description of the schema
-    rst += _get_schema_header(
-        _schema,
+def generate_iter(schema: dict, **kwargs) -> Iterator[str]:
+    """
+    Generate reStructuredText for a given JSON schema as a sequence of chunks.
+
+    Accepts the same keyword arguments as `generate`, joining the chunks gives
+    the same string `generate` returns.
+    """
+    stats = kwargs.pop("stats", None)
+    return Converter(**kwargs).generate_iter(schema, stats=stats)
+
+
+def compile_schema(
+    schema: dict, previous: Optional[RenderPlan] = None, **kwargs
+) -> RenderPlan:
+    """
+    Compile a JSON schema into a plan, to render with `render_plan`.
+
+    Accepts the same keyword arguments as `generate`. Sections of a `previous`
+    plan compiled from the same content with the same options are reused.
+    """
+    return Converter(**kwargs).compile(schema, previous=previous)
+
+
+def render_plan(plan: RenderPlan) -> str:
+    """
+    Render a compiled plan as a reStructuredText string.
+
+    Gives the same string `generate` returns for the schema of the plan.
+    """
+    return "".join(render_plan_iter(plan))
+
+
+def render_plan_iter(plan: RenderPlan) -> Iterator[str]:
+    """
+    Render a compiled plan as a sequence of reStructuredText chunks.
+    """
+    return _strip_chunks(
+        itertools.chain.from_iterable(
+            _render_section(section) for section in plan.sections
+        )
+    )
+
+
+def _render_root(schema: dict, title: str, ctx: RenderContext) -> Iterator[str]:
+    """
+    Yield the unstripped chunks of the root section of the document.
+    """
+
+    yield from _render_section(_compile_root(schema, title, ctx))
+
+
+def _render_definition(key: str, definition: dict, ctx: RenderContext) -> Iterator[str]:
+    """
+    Get the unstripped chunks of the section of a definition, timed when profiling.
+    """
+
+    chunks = _definition_section(key, definition, ctx)
+    if ctx.stats is not None:
+        chunks = timed(chunks, functools.partial(ctx.stats.add_definition, key))
+    return chunks
+
+
+def _definition_section(
+    key: str, definition: dict, ctx: RenderContext
+) -> Iterator[str]:
+    yield from _render_section(_compile_definition(key, definition, ctx))
+
+
+def _compile_root(
+    schema: dict, title: str, ctx: RenderContext, key: Optional[str] = None
+) -> Section:
+    return _compile_section(
         title,
+        schema,
         "JSON Schema missing a description, provide it using the `description` key in the root of the JSON document.",
-        section_punctuation,
-        schema_level=0
+        0,
+        [],
+        ctx,
+        key,
     )
 
-    defs = _schema.get("definitions", _schema.get("$defs", {}))
-    rst += _create_definition_table(
-        [], _schema, defs, section_punctuation, section_level=0
+
+def _compile_definition(
+    name: str, definition: dict, ctx: RenderContext, key: Optional[str] = None
+) -> Section:
+    return _compile_section(
+        name,
+        definition,
+        "No description provided for this model.",
+        1,
+        [name],
+        ctx,
+        key,
     )
 
-    if defs:
-        for key, definition in defs.items():
 
-            if suppress_undocumented and not any(
-                definition.get(k) for k in ["title", "description", "examples"]
-            ):
+def _compile_section(
+    label: str,
+    schema: dict,
+    description_fallback: str,
+    schema_level: int,
+    json_path: list,
+    ctx: RenderContext,
+    key: Optional[str] = None,
+) -> Section:
+    """
+    Compile the title, description and table of a schema.
+
+    If nested, all headings are increased by one level.
+    """
+
+    return Section(
+        label=label,
+        anchor=dashify(label),
+        heading=schema.get("title", label),
+        underline=ctx.section_punctuation[schema_level],
+        description=schema.get("description", description_fallback).strip(" \n"),
+        type=schema.get("type", "object(?)").strip(),
+        table=_compile_table(json_path, schema, ctx, section_level=0),
+        key=key,
+    )
+
+
+def _render_section(section: Section) -> Iterator[str]:
+    """
+    Yield the unstripped chunks of a compiled section.
+    """
+
+    yield (
+        create_section(section.underline, section.anchor, section.heading)
+        + section.description
+        + "\n\n"
+        + f"Type: `{section.type}`\n\n"
+    )
+    yield from _flatten(_render_table(section.table))
+
+
+def _render_definitions_in_pool(
+    payload: bytes, keys: list, workers: int, ctx: RenderContext
+) -> Iterator[str]:
+    """
+    Render the sections of the definitions in a process pool, in order.
+
+    Yields each section as a tuple holding its reStructuredText.
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_definition_worker,
+        initargs=(payload,),
+    )
+    try:
+        for rst, cache_hits, cache_misses, pruned, stats in executor.map(
+            _render_definition_in_worker, keys
+        ):
+            ctx.cache_hits += cache_hits
+            ctx.cache_misses += cache_misses
+            ctx.pruned += pruned
+            if ctx.stats is not None and stats is not None:
+                ctx.stats.merge(stats)
+            yield (rst,)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _dumps_run(run: tuple) -> bytes:
+    """
+    Pickle the arguments of a run for the pool workers.
+
+    Read-only `MappingProxyType` views cannot be pickled, they are sent as
+    dicts, keeping shared and recursive subschemas as they are.
+    """
+    f = io.BytesIO()
+    pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[MappingProxyType] = _reduce_mapping_proxy
+    pickler.dump(run)
+    return f.getvalue()
+
+
+def _reduce_mapping_proxy(proxy: MappingProxyType) -> tuple:
+    # The items are set after the dict is created and memoized, so that
+    # recursive references resolve to it
+    return dict, (), None, None, iter(proxy.items())
+
+
+# The context and definitions of the run a pool worker renders sections for
+_worker_run = None
+
+
+def _init_definition_worker(payload: bytes) -> None:
+    global _worker_run
+
+    options, schema, title, profile = pickle.loads(payload)
+    ctx, definitions = Converter(**options)._start_run(schema, title)
+    _worker_run = (ctx, dict(definitions), profile)
+
+
+def _render_definition_in_worker(key: str) -> tuple:
+    ctx, definitions, profile = _worker_run
+    cache_hits, cache_misses, pruned = ctx.cache_hits, ctx.cache_misses, ctx.pruned
+    # Each section gets its own measurements, merged by the parent process
+    ctx.stats = RenderStats() if profile else None
+
+    rst = "".join(_render_definition(key, definitions[key], ctx))
+
+    return (
+        rst,
+        ctx.cache_hits - cache_hits,
+        ctx.cache_misses - cache_misses,
+        ctx.pruned - pruned,
+        ctx.stats,
+    )
+
+
+def _phase(stats: Optional[RenderStats], phase: str):
+    """
+    Time a block of code as a phase of `stats`, if given.
+    """
+    return stats.phase(phase) if stats is not None else contextlib.nullcontext()
+
+
+def _file_stem(key: str) -> str:
+    """
+    Get the file stem of a definition, without path separators or leading dots,
+    so that its file is in the directory of the definitions.
+    """
+    return dashify(key).translate(PATH_SEPARATORS).lstrip(".") or "definition"
+
+
+def _unique_stem(stem: str, stems: set) -> str:
+    """
+    Get a file stem not in `stems` yet, and add it.
+
+    Definitions whose names only differ by case, spaces or underscores get a
+    numbered suffix.
+    """
+    unique = stem
+    n = 1
+    while unique in stems:
+        n += 1
+        unique = f"{stem}-{n}"
+    stems.add(unique)
+    return unique
+
+
+def _flatten(chunks: Iterator) -> Iterator[str]:
+    """
+    Flatten chunks where nested tables are given as iterators of chunks.
+
+    Uses an explicit stack, so deeply nested schemas do not hit the
+    recursion limit.
+    """
+
+    stack = [iter(chunks)]
+    while stack:
+        for chunk in stack[-1]:
+            if isinstance(chunk, str):
+                yield chunk
+            else:
+                stack.append(iter(chunk))
+                break
+        else:
+            stack.pop()
+
+
+def _drop_leading_transition(rst: str) -> str:
+    """
+    Remove the transition a section starts with, when it is the start of a file.
+    """
+    if rst.startswith("----\n"):
+        return rst[len("----\n") :].lstrip("\n")
+    return rst
+
+
+def _strip_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Strip leading and trailing spaces and newlines from a stream of chunks.
+
+    The stream is terminated by a single newline. Trailing whitespace is held
+    back until a chunk with other content follows it.
+    """
+
+    started = False
+    pending = ""
+
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip(" \n")
+            if not chunk:
                 continue
+            started = True
 
-            rst += _get_schema_header(
-                definition,
-                key,
-                "No description provided for this model.",
-                section_punctuation,
-                schema_level=1
-            )
-            rst += _create_definition_table(
-                [key], definition, defs, section_punctuation, section_level=0
-            )
+        stripped = chunk.rstrip(" \n")
+        if stripped:
+            yield pending + stripped if pending else stripped
+            pending = chunk[len(stripped):]
+        else:
+            pending += chunk
 
-    res = rst.strip(" \n")
-    res += "\n"
+    yield "\n"
 
-    return res
 
+def _compile_table(
+    json_path: list, schema: dict, ctx: RenderContext, section_level: int
+) -> Table:
+    """
+    Compile the table of the properties in a schema, with the tables of
+    nested objects and arrays.
 
-def _create_definition_table(json_path: list, schema: dict, defs: dict,
-                             section_punctuation, section_level) -> str:
+    Uses an explicit stack, so deeply nested schemas do not hit the recursion
+    limit. The subschema of a nested table is registered in `ctx.anchors`
+    while its own nested tables are compiled, so cycles link back to it.
     """
-    Create a table of the properties in the schema.
 
-    Returns: reStructuredText table with the following columns
-    - Property name
-    - Type
-    - Required
-    - Possible Values / Definition Subschema
-    - Deprecated
-    - Default value
-    - Description
-    - Examples
+    table, children = _compile_table_rows(json_path, schema, ctx, section_level)
+
+    # The table, its rows left to expand, and the subschema it registered
+    stack = [(table, iter(children), None)]
+    try:
+        while stack:
+            parent, pending, _ = stack[-1]
+            for row, property_details in pending:
+                registered = id(property_details) not in ctx.anchors
+                if registered:
+                    ctx.anchors[id(property_details)] = (row.name, row.anchor)
+
+                row.detail.nested, nested_children = _compile_table_rows(
+                    parent.json_path + [row.name],
+                    property_details,
+                    ctx,
+                    parent.level + 1,
+                )
+                stack.append(
+                    (
+                        row.detail.nested,
+                        iter(nested_children),
+                        id(property_details) if registered else None,
+                    )
+                )
+                break
+            else:
+                _, _, registered_id = stack.pop()
+                if registered_id is not None:
+                    del ctx.anchors[registered_id]
+    finally:
+        for _, _, registered_id in stack:
+            if registered_id is not None:
+                ctx.anchors.pop(registered_id, None)
+
+    return table
+
+
+def _compile_table_rows(
+    json_path: list, schema: dict, ctx: RenderContext, section_level: int
+) -> tuple:
+    """
+    Compile a table of the properties in the schema, without nested tables.
+
+    Returns the table and the rows of the nested objects and arrays whose
+    table is left to compile, with their subschema.
 
     Search for deprecated string in the description or a deprecated key set to true in the property
     """
 
-    indentation = "   " * section_level
+    # Debug messages use deferred formatting, so the schema is only formatted
+    # when a sink actually accepts DEBUG messages
+    ctx.logger.debug("Creating definition table for schema: {}", schema)
 
-    logger.debug(f"Creating definition table for schema: {schema}")
+    table = Table(schema.get("title", ""), json_path, section_level)
+    children = []
 
     if schema.get("enum"):
-        logger.debug("Creating enum reStructuredText")
-        return create_enum(schema)
+        ctx.logger.debug("Creating enum reStructuredText")
+        table.text = create_enum(schema)
+        return table, children
 
     if schema.get("const"):
-        logger.debug("Creating const reStructuredText")
-        return create_const(schema)
-
-    rst = ""
+        ctx.logger.debug("Creating const reStructuredText")
+        table.text = create_const(schema)
+        return table, children
 
     # Add a warning before the table to indicate if additional properties are allowed
-    if not schema.get("additionalProperties", True):
-        rst += "   ⚠️ Additional properties are not allowed.\n\n"
+    table.closed = not schema.get("additionalProperties", True)
 
     if not schema.get("properties"):
-        return rst
+        return table, children
+
+    stats = ctx.stats
 
-    # Use the sort_properties function to maintain the order
-    sorted_properties = sort_properties(schema)
+    # Undocumented properties are pruned before anything is formatted
+    sortable = schema
+    if ctx.documented is not None:
+        properties = _prune_properties(schema["properties"], ctx)
+        if not properties:
+            return table, children
+        sortable = {"properties": properties, "required": schema.get("required", ())}
 
-    table_items = []
-    item_details = []
+    with _phase(stats, "sort_properties"):
+        properties = sort_properties(sortable, ctx.property_order)
+
+    # The anchors of the properties start with the path of the table
+    anchor_prefix = "".join(f"{dashify(item)}-" for item in json_path)
+
+    for property_name, property_details in properties.items():
+        if stats is not None:
+            start = time.perf_counter()
 
-    for property_name, property_details in schema["properties"].items():
         property_type = property_details.get("type")
 
-        logger.debug(f"Processing {property_name} of type {property_type}")
-        logger.debug(f"Property details: {property_details}")
+        ctx.logger.debug("Processing {} of type {}", property_name, property_type)
+        ctx.logger.debug("Property details: {}", property_details)
 
-        type_formatted, possible_values = _get_property_details(
-            property_type, property_details, defs
-        )
+        with _phase(stats, "property_details"):
+            type_formatted, possible_values = _get_property_details(
+                property_type, property_details, ctx
+            )
 
         type_formatted = strip_inside_backticks(type_formatted)
         possible_values = strip_inside_backticks(possible_values)
 
-        logger.debug(
-            f"Finished processing {property_name} of type {property_type}: {possible_values}"
+        ctx.logger.debug(
+            "Finished processing {} of type {}: {}",
+            property_name,
+            property_type,
+            possible_values,
         )
 
         default = property_details.get("default")
@@ -191,7 +1124,7 @@ def _create_definition_table(json_path: list, schema: dict, defs: dict,
             required = "Optional"
 
         # Create an item anchor (with context) for referencing from table to item detail
-        item_anchor = dashify("-".join(json_path + [property_name]))
+        item_anchor = anchor_prefix + dashify(property_name)
 
         # Short description is either title or first sentence of description
         if property_details.get("title"):
@@ -206,92 +1139,168 @@ def _create_definition_table(json_path: list, schema: dict, defs: dict,
         # Add backticks for each example, and join them with a comma and a space into a single string
         examples = ", ".join(
             [
-                f"``{json.dumps(example)}``"
+                f"``{json.dumps(example, default=to_json)}``"
                 for example in property_details.get("examples", [])
             ]
         )
 
-        item = {
-            "property": f":ref:`{property_name} <{item_anchor}>`",
-            "type": f"\"{type_formatted}\"",
-            "required": f"\"{required}\"",
-            "description": f"\"{short_description}\""
-        }
+        row = PropertyRow(
+            name=property_name,
+            anchor=item_anchor,
+            type=type_formatted,
+            required=required,
+            summary=short_description,
+            detail=DetailBlock(
+                description=description,
+                deprecated=bool(property_details.get("deprecated")),
+                default=json.dumps(default, default=to_json) if default else None,
+                possible_values=possible_values,
+                examples=examples,
+            ),
+        )
+        table.rows.append(row)
 
-        table_items.append(item)
+        # If field type is object or array, add a table of its properties.
+        # This probably doesn't work for arrays yet...
+        if property_type in ["object", "array"]:
+            reference = ctx.anchors.get(id(property_details))
+
+            if reference:
+                # Rendered in its own section, or a cycle back to a parent
+                row.detail.reference = reference
+            elif ctx.max_depth is not None and section_level >= ctx.max_depth:
+                if property_details.get("properties"):
+                    row.detail.depth_limit = ctx.max_depth
+            else:
+                children.append((row, property_details))
 
-        # Generate item detail
-        item_detail = f"\n----\n\n.. _{item_anchor}:\n\n"
+        if stats is not None:
+            stats.add_property(
+                ".".join(json_path + [property_name]), time.perf_counter() - start
+            )
+            stats.count("properties")
 
-        # Contextual (breadcrumb) header to field details
-        # e.g. "Root > Parent > Field"
-        # The path is italic with the last item in bold
-        item_detail += (indentation +
-                        " > ".join([f":ref:`{item} <{dashify(item)}>`" for item in json_path] +
-                                   [f"**{property_name}**"]) +
-                        "\n\n")
+    return table, children
 
-        if description:
-            item_detail += indentation + f"{description}\n\n"
 
-        item_detail += indentation + f":Type: {type_formatted}\n"
+def _prune_properties(properties: dict, ctx: RenderContext) -> dict:
+    """
+    Remove the properties that are not documented, with everything nested in
+    them.
 
-        item_detail += indentation + f":Required: {required}\n"
+    References are kept, they are documented by the section of their
+    definition.
+    """
+    kept = {
+        name: details
+        for name, details in properties.items()
+        if "$ref" in details or ctx.documented(details)
+    }
 
-        if property_details.get("deprecated"):
-            item_detail += indentation + f":Deprecated: {item['deprecated']}\n"
+    pruned = len(properties) - len(kept)
+    if pruned:
+        ctx.pruned += pruned
+        if ctx.stats is not None:
+            ctx.stats.count("pruned", pruned)
+    return kept
 
-        if default:
-            item_detail += indentation + f":Default: `{json.dumps(default)}`\n"
 
-        if possible_values:
-            item_detail += indentation + f":Possible Values: {possible_values}\n"
+def _render_table(table: Table) -> Iterator:
+    """
+    Render a compiled table.
 
-        if examples:
-            item_detail += indentation + f":Examples: {examples}\n"
+    Yields: reStructuredText table with the following columns
+    - Property name
+    - Type
+    - Required
+    - Description
 
-        item_details.append(item_detail)
+    followed by the details of each property, with the tables of nested
+    objects and arrays given as iterators of chunks, to be flattened with
+    `_flatten`.
+    """
 
-        # If field type is object or array, add a table of its properties
-        # by recursively calling this function.
-        # This probably doesn't work for arrays yet...
-        if property_type in ["object", "array"]:
-            item_details.append(
-                "\n" +
-                _create_definition_table(
-                    json_path + [property_name],
-                    property_details,
-                    defs,
-                    section_punctuation,
-                    section_level + 1
-                )
-            )
+    if table.text is not None:
+        yield table.text
+        return
+
+    if table.closed:
+        yield "   ⚠️ Additional properties are not allowed.\n\n"
 
-    # This should not happen, but just in case
-    if not table_items:
-        rst += "No items to display."
-        return rst
+    if not table.rows:
+        return
 
-    # Generate the header row
-    capitalized_columns = [
-        f'"{col.replace("_", " ").capitalize()}"' for col in table_items[0]
-    ]
+    indentation = "   " * table.level
+    nested_indentation = "   " * (table.level + 1)
 
     # Generate the table
-    rst += (f".. csv-table:: {schema.get('title', '')}\n"
-            f"   :header: {', '.join(capitalized_columns)}\n\n")
+    yield (
+        f".. csv-table:: {table.title}\n"
+        f'   :header: "Property", "Type", "Required", "Description"\n\n'
+    )
 
     # Generate the item rows
-    for item in table_items:
-        rst += f"   {', '.join(item.values())}\n"
+    for row in table.rows:
+        yield (
+            f"   :ref:`{row.name} <{row.anchor}>`, "
+            f'"{row.type}", "{row.required}", "{row.summary}"\n'
+        )
+
+    # Contextual (breadcrumb) header to field details
+    # e.g. "Root > Parent > Field"
+    # The path is italic with the last item in bold
+    breadcrumb = "".join(
+        f":ref:`{item} <{dashify(item)}>` > " for item in table.json_path
+    )
+
+    for row in table.rows:
+        detail = row.detail
+        item_detail = [f"\n----\n\n.. _{row.anchor}:\n\n"]
+        item_detail.append(indentation + breadcrumb + f"**{row.name}**\n\n")
+
+        if detail.description:
+            item_detail.append(indentation + f"{detail.description}\n\n")
+
+        item_detail.append(indentation + f":Type: {row.type}\n")
+        item_detail.append(indentation + f":Required: {row.required}\n")
 
-    return rst + "".join(item_details)
+        if detail.deprecated:
+            item_detail.append(indentation + ":Deprecated: Yes\n")
 
+        if detail.default is not None:
+            item_detail.append(indentation + f":Default: `{detail.default}`\n")
 
-def _get_property_ref(ref, defs):
+        if detail.possible_values:
+            item_detail.append(
+                indentation + f":Possible Values: {detail.possible_values}\n"
+            )
+
+        if detail.examples:
+            item_detail.append(indentation + f":Examples: {detail.examples}\n")
+
+        yield "".join(item_detail)
+
+        if detail.reference:
+            label, anchor = detail.reference
+            yield f"\n{nested_indentation}See :ref:`{label} <{anchor}>`.\n"
+        elif detail.depth_limit is not None:
+            yield (
+                f"\n{nested_indentation}Nested properties are not shown, "
+                f"the maximum depth of {detail.depth_limit} is reached.\n"
+            )
+        elif detail.nested is not None:
+            yield "\n"
+            yield _render_table(detail.nested)
+
+
+def _get_property_ref(ref: str, ctx: RenderContext):
+    return ctx.cached(ctx.ref_cache, ref, _compute_property_ref, ref, ctx)
+
+
+def _compute_property_ref(ref: str, ctx: RenderContext):
     ref = ref.split("/")[-1]
-    t = defs[ref].get("type")
-    if ref in defs:
+    if ref in ctx.defs:
+        t = ctx.defs[ref].get("type")
         return (
             f"`{t}`" if t else "Missing type",
             f":ref:`{ref} <{dashify(ref)}>`",
@@ -300,7 +1309,7 @@ def _get_property_ref(ref, defs):
         return "Missing type", "Missing definition"
 
 
-def get_property_if_ref(property_details: dict, defs) -> tuple:
+def get_property_if_ref(property_details: dict, ctx: RenderContext) -> tuple:
     """
     Check if the property is a reference.
     """
@@ -308,22 +1317,22 @@ def get_property_if_ref(property_details: dict, defs) -> tuple:
     # Check if the property is a reference
     ref_from_property = property_details.get("$ref")
     if ref_from_property:
-        return _get_property_ref(ref_from_property, defs)
+        return _get_property_ref(ref_from_property, ctx)
 
     # Check if the property is a reference in additionalProperties
     ref_from_additional_properties = (
         property_details["additionalProperties"].get("$ref")
-        if isinstance(property_details.get("additionalProperties"), dict)
+        if isinstance(property_details.get("additionalProperties"), Mapping)
         else None
     )
     if ref_from_additional_properties:
-        return _get_property_ref(ref_from_additional_properties, defs)
+        return _get_property_ref(ref_from_additional_properties, ctx)
 
     return None, None
 
 
 def _handle_array_like_property(
-    property_type: str, property_details: dict, defs: dict, is_array=False
+    property_type: str, property_details: dict, ctx: RenderContext, is_array=False
 ):
     """
     Handle properties that are array-like.
@@ -343,8 +1352,10 @@ def _handle_array_like_property(
     )
 
     if array_type is None:
-        logger.warning(
-            f"Array-like property without oneOf, anyOf or allOf: {property_type} {property_details}"
+        ctx.logger.warning(
+            "Array-like property without oneOf, anyOf or allOf: {} {}",
+            property_type,
+            property_details,
         )
         # TODO: Support for items, prefixItems, contains, minContains, maxContains, uniqueItems, unevaluatedItems
         # https://json-schema.org/understanding-json-schema/reference/array
@@ -352,22 +1363,27 @@ def _handle_array_like_property(
 
     array_separator = {"oneOf": " or ", "anyOf": " and/or ", "allOf": " and "}
 
+    # Leave out the first null variant, the schema itself is not modified
+    variants = property_details[array_type]
     removed_null = False
-    with contextlib.suppress(Exception):
-        property_details[array_type].remove({"type": "null"})
-        removed_null = True
+    if isinstance(variants, (list, tuple)):
+        for i, value in enumerate(variants):
+            if value == {"type": "null"}:
+                variants = [*variants[:i], *variants[i + 1 :]]
+                removed_null = True
+                break
 
     types = []
     details = []
 
-    for value in property_details[array_type]:
-        ref_type, ref_details = get_property_if_ref(value, defs)
+    for value in variants:
+        ref_type, ref_details = get_property_if_ref(value, ctx)
         if ref_type or ref_details:
             types.append(ref_type)
             details.append(ref_details)
         else:
             ref_type, ref_details = _get_property_details(
-                value.get("type"), value, defs
+                value.get("type"), value, ctx
             )
             types.append(ref_type)
             details.append(ref_details)
@@ -396,22 +1412,52 @@ def _handle_array_like_property(
 
 
 def _get_property_details(
-    property_type: str, property_details: dict, defs: dict
+    property_type: str, property_details: dict, ctx: RenderContext
 ) -> tuple[str, str]:
     """
     Get the possible values for a property.
+
+    Computed once per subschema and type in a run, shared definitions are
+    usually the same object wherever they are referenced.
     """
+    key = (id(property_details), property_type)
+
+    if key in ctx.details_in_progress:
+        # The subschema contains itself, through items or anyOf for instance
+        reference = ctx.anchors.get(id(property_details))
+        if reference:
+            return f"`{property_type}`", f":ref:`{reference[0]} <{reference[1]}>`"
+        return f"`{property_type}`", "Recursive subschema"
+
+    ctx.details_in_progress.add(key)
+    try:
+        return ctx.cached(
+            ctx.details_cache,
+            key,
+            _compute_property_details,
+            property_type,
+            property_details,
+            ctx,
+        )
+    finally:
+        ctx.details_in_progress.discard(key)
+
+
+def _compute_property_details(
+    property_type: str, property_details: dict, ctx: RenderContext
+) -> tuple[str, str]:
 
     # Check if the property is a reference
-    ref_type, ref_details = get_property_if_ref(property_details, defs)
+    ref_type, ref_details = get_property_if_ref(property_details, ctx)
     if ref_type or ref_details:
         return ref_type, ref_details
 
     if "additionalProperties" in property_details and not isinstance(
         property_details["additionalProperties"], bool
     ):
-        logger.warning(
-            f"Additional properties not a boolean: {property_details['additionalProperties']}"
+        ctx.logger.warning(
+            "Additional properties not a boolean: {}",
+            property_details["additionalProperties"],
         )
         # new_type = property_details["additionalProperties"].get("type")
         # return new_type, new_type
@@ -424,7 +1470,7 @@ def _get_property_details(
 
     # Handle array-like properties
     if any(key in property_details for key in ["oneOf", "anyOf", "allOf"]):
-        t, d = _handle_array_like_property(property_type, property_details, defs)
+        t, d = _handle_array_like_property(property_type, property_details, ctx)
         if t and d:
             return t, d
 
@@ -434,17 +1480,17 @@ def _get_property_details(
     if "items" in property_details:
         if any(key in property_details["items"] for key in ["oneOf", "anyOf", "allOf"]):
             t, d = _handle_array_like_property(
-                property_type, property_details["items"], defs, is_array=True
+                property_type, property_details["items"], ctx, is_array=True
             )
             if t and d:
                 return t, d
 
-        ref_type, ref_details = get_property_if_ref(property_details["items"], defs)
+        ref_type, ref_details = get_property_if_ref(property_details["items"], ctx)
         if ref_type or ref_details:
             return f"`{property_type}`", ref_details
         else:
             ref_type, ref_details = _get_property_details(
-                property_details["items"].get("type"), property_details["items"], defs
+                property_details["items"].get("type"), property_details["items"], ctx
             )
             return f"`{property_type}`", ref_details
 
@@ -0,0 +1,104 @@
+import functools
+import json
+import mmap
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(data):
+    """
+    Parse a JSON document from a bytes-like object, with `orjson` when it is
+    installed.
+
+    Documents `orjson` rejects but `json` accepts, such as integers larger
+    than 64 bits or `NaN`, are parsed again with `json`.
+    """
+    if orjson is not None:
+        with memoryview(data) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(bytes(data))
+
+
+def load_yaml(data):
+    """
+    Parse a YAML document from bytes or a binary stream, with the C
+    `CSafeLoader` when libyaml is available.
+
+    Dates and timestamps are kept as strings, as in a JSON document.
+    """
+    import yaml
+
+    try:
+        return yaml.load(data, Loader=_yaml_loader())
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """
+    Create a safe YAML loader without the implicit timestamp type.
+    """
+    import yaml
+
+    base = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    resolvers = {
+        first: [
+            (tag, regexp)
+            for tag, regexp in entries
+            if tag != "tag:yaml.org,2002:timestamp"
+        ]
+        for first, entries in base.yaml_implicit_resolvers.items()
+    }
+    return type("JsonSchemaLoader", (base,), {"yaml_implicit_resolvers": resolvers})
+
+
+# The parser of each file suffix
+LOADERS = {
+    ".json": load_json,
+    ".yaml": load_yaml,
+    ".yml": load_yaml,
+}
+
+
+def check_schema(schema):
+    """
+    Check that a parsed document is a schema, raising `ValueError` if it is not
+    an object.
+    """
+    if not isinstance(schema, Mapping):
+        raise ValueError("The schema must be an object")
+    return schema
+
+
+def get_loader(path) -> Callable:
+    """
+    Get the parser of a schema file from its suffix, JSON if it is unknown.
+    """
+    return LOADERS.get(Path(path).suffix.lower(), load_json)
+
+
+def load_schema(path):
+    """
+    Load a JSON or YAML schema file, chosen by the suffix of `path`.
+
+    The file is memory-mapped and parsed from bytes, so it is not copied into
+    a decoded string first.
+    """
+    loader = get_loader(path)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return loader(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loader(data)
@@ -1,8 +1,25 @@
+import contextlib
 import json
+import sys
+import time
 
 import click
 
 import jsonschema_restructuredtext
+import jsonschema_restructuredtext.constants
+from jsonschema_restructuredtext.batch import (
+    DEFAULT_OUTPUT_TEMPLATE,
+    OUTPUT_TEMPLATE_FIELDS,
+    TITLE_FIELDS,
+    check_template,
+    convert_files,
+    find_schema_files,
+)
+from jsonschema_restructuredtext.cache import DEFAULT_MAX_SIZE, MemoryCache, RenderCache
+from jsonschema_restructuredtext.constants import DEFAULT_HOST, DEFAULT_PORT
+from jsonschema_restructuredtext.loaders import check_schema, load_json, load_schema
+from jsonschema_restructuredtext.stats import RenderStats
+from jsonschema_restructuredtext.watch import DEFAULT_INTERVAL, Watcher
 
 def parse_comma_separated(ctx, param, value):
     if not value:
@@ -14,65 +31,500 @@ def parse_comma_separated(ctx, param, value):
     # Split on commas to create a list
     return [item.strip() for item in combined.split(",")]
 
-@click.command()
-@click.argument("filename", type=click.File("r"))
+
+# The options of the converter, shared by the commands
+_CONVERTER_OPTIONS = [
+    click.option(
+        "--resolve/--no-resolve",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="[Experimental] Resolve $ref pointers.",
+    ),
+    click.option(
+        "--suppress-undocumented/--no-suppress-undocumented",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Suppress output of properties that do not have title, description, or examples.",
+    ),
+    click.option(
+        "--section-punctuation",
+        multiple=True,
+        default=jsonschema_restructuredtext.constants.DEFAULT_SECTION_PUNCTUATION,
+        show_default=True,
+        callback=parse_comma_separated,
+        help="Provide a comma-separated list of punctuation values to use for sections.",
+    ),
+    click.option(
+        "--max-depth",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Maximum nesting depth of property tables.  [default: unlimited]",
+    ),
+    click.option(
+        "--property-order",
+        multiple=True,
+        type=click.Choice(jsonschema_restructuredtext.constants.PROPERTY_ORDERS),
+        help="Sort the properties of each table with the required ones first, the "
+        "deprecated ones last or alphabetically. Can be given several times, the "
+        "first one taking precedence.  [default: source order]",
+    ),
+]
+
+
+def converter_options(f):
+    """
+    Add the options of the converter to a command.
+    """
+    for option in reversed(_CONVERTER_OPTIONS):
+        f = option(f)
+    return f
+
+
+cache_max_size_option = click.option(
+    "--cache-max-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_SIZE // (1024 * 1024),
+    show_default=True,
+    help="Maximum size of the cache in MiB.",
+)
+
+debug_option = click.option(
+    "--debug/--no-debug",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Enable debug output.",
+)
+
+
+class DefaultGroup(click.Group):
+    """
+    Group of commands running its `default` command when the first argument
+    is not the name of a command, so that the commands are optional.
+    """
+
+    def __init__(self, *args, default: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.default = default
+
+    def parse_args(self, ctx, args):
+        if not args or args[0] not in self.commands:
+            args = [self.default, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultGroup, default="convert")
+def cli():
+    """
+    Convert JSON schemas to reStructuredText.
+    """
+
+
+@cli.command()
+@click.argument("filenames", nargs=-1, required=True)
 @click.option(
     "-t",
     "--title",
     type=str,
-    help="Do not use the title from the schema, use this title instead.",
+    help="Do not use the title from the schema, use this title instead. "
+    "With --output-dir, '{stem}' is replaced by the name of each file, "
+    "which is the default title.",
 )
 @click.option(
-    "--resolve/--no-resolve",
-    is_flag=True,
-    default=False,
+    "-o",
+    "--output-dir",
+    type=click.Path(file_okay=False, writable=True),
+    help="Convert every file, directory or glob pattern given and write the "
+    "output to this directory.",
+)
+@click.option(
+    "--output-template",
+    default=DEFAULT_OUTPUT_TEMPLATE,
     show_default=True,
-    help="[Experimental] Resolve $ref pointers.",
+    help="Filename of each output file in --output-dir, '{stem}' and '{name}' "
+    "are replaced by the stem and name of the schema file.",
 )
 @click.option(
-    "--suppress-undocumented/--no-suppress-undocumented",
+    "--split",
     is_flag=True,
     default=False,
-    show_default=True,
-    help="Suppress output of properties that do not have title, description, or examples.",
+    help="With --output-dir, write the section of each definition to its own "
+    "file, in a directory named after the output file, which gets a toctree "
+    "of them. Only the files that changed are written.",
+)
+@converter_options
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, writable=True),
+    help="Cache rendered documents and definitions in this directory, and only "
+    "render what changed since the previous run.",
 )
+@cache_max_size_option
 @click.option(
-    "--section-punctuation",
-    multiple=True,
-    default=jsonschema_restructuredtext.constants.DEFAULT_SECTION_PUNCTUATION,
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
     show_default=True,
-    callback=parse_comma_separated,
-    help="Provide a comma-separated list of punctuation values to use for sections.",
+    help="Number of processes converting files in parallel with --output-dir, "
+    "or definitions of a single file otherwise.",
 )
 @click.option(
-    "--debug/--no-debug",
+    "-w",
+    "--watch",
     is_flag=True,
     default=False,
+    help="Keep running with --output-dir, and convert the schema files again "
+    "when they change. Rendered definitions are cached in memory unless "
+    "--cache-dir is given.",
+)
+@click.option(
+    "--watch-interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_INTERVAL,
     show_default=True,
-    help="Enable debug output.",
+    help="Seconds between checks for changed files with --watch.",
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the time and call counts of each phase of the conversion, of "
+    "each definition and of the slowest properties to this file as JSON.",
 )
+@debug_option
 @click.version_option(package_name="jsonschema_restructuredtext")
-def cli(filename, title, resolve, suppress_undocumented, section_punctuation, debug):
+def convert(
+    filenames,
+    title,
+    output_dir,
+    output_template,
+    split,
+    resolve,
+    suppress_undocumented,
+    section_punctuation,
+    max_depth,
+    property_order,
+    cache_dir,
+    cache_max_size,
+    jobs,
+    watch,
+    watch_interval,
+    profile,
+    debug,
+):
     """
-    Load FILENAME and output a reStructuredText version.
+    Load FILENAMES and output a reStructuredText version.
 
-    Use '-' as FILENAME to read from stdin.
+    Use '-' as FILENAME to read from stdin. Without --output-dir, a single
+    FILENAME is converted to stdout. With --output-dir, each FILENAME can be a
+    file, a directory or a glob pattern, and every schema found is converted in
+    the same process.
+
+    Files with a .yaml or .yml suffix are read as YAML, other files and stdin
+    as JSON.
+
+    To render schemas for other tools without starting a new process each
+    time, see 'serve --help'.
     """
 
-    file_contents = json.loads(filename.read())
+    configure_logging(debug)
 
     kwargs = {
         "replace_refs": resolve,
         "suppress_undocumented": suppress_undocumented,
         "section_punctuation": section_punctuation,
+        "max_depth": max_depth,
+        "property_order": property_order,
         "debug": debug,
     }
 
+    if watch and not output_dir:
+        raise click.UsageError("Use --output-dir with --watch.")
+    if split and not output_dir:
+        raise click.UsageError("Use --output-dir with --split.")
+    if watch and profile:
+        raise click.UsageError("--profile cannot be used with --watch.")
+    if output_dir:
+        _check_template(title, TITLE_FIELDS, "--title")
+        _check_template(output_template, OUTPUT_TEMPLATE_FIELDS, "--output-template")
+
+    cache = None
+    if cache_dir:
+        cache = RenderCache(cache_dir, cache_max_size * 1024 * 1024)
+        kwargs["cache"] = cache
+    elif watch:
+        kwargs["cache"] = MemoryCache(cache_max_size * 1024 * 1024)
+
+    if watch:
+        kwargs["workers"] = jobs
+        _watch(
+            filenames,
+            output_dir,
+            output_template,
+            title,
+            split,
+            watch_interval,
+            kwargs,
+        )
+        return
+
+    if output_dir:
+        _convert_batch(
+            filenames, output_dir, output_template, title, split, jobs, profile, kwargs
+        )
+        return
+
+    if len(filenames) > 1:
+        raise click.UsageError("Use --output-dir to convert more than one FILENAME.")
+
     if title:
         kwargs["title"] = title
+    kwargs["workers"] = jobs
+
+    stats = RenderStats() if profile else None
+    start = time.perf_counter()
+
+    if stats is None:
+        file_contents = _load(filenames[0])
+    else:
+        with stats.phase("load"):
+            file_contents = _load(filenames[0])
+
+    # Convert the file contents to restructuredtext, streaming it to stdout
+    jsonschema_restructuredtext.generate_to(
+        file_contents, sys.stdout, stats=stats, **kwargs
+    )
+    sys.stdout.flush()
+
+    if stats is not None:
+        stats.add("total", time.perf_counter() - start)
+        _write_profile(profile, stats.as_dict())
+
+    if cache:
+        click.echo(f"Cache: {cache.hits} hits, {cache.misses} misses", err=True)
+
+
+def configure_logging(debug=False):
+    """
+    Send the log messages of the converter to stderr, instead of the default
+    loguru sink.
+    """
+
+    import loguru
+
+    loguru.logger.remove()
+    loguru.logger.add(
+        sys.stderr,
+        level="DEBUG" if debug else "INFO",
+        filter="jsonschema_restructuredtext",
+    )
+
+
+def _load(filename):
+    """
+    Load a schema file, or a JSON schema from stdin with '-'.
+    """
+
+    try:
+        if filename == "-":
+            return check_schema(load_json(sys.stdin.buffer.read()))
+        return check_schema(load_schema(filename))
+    except (OSError, ValueError) as e:
+        raise click.ClickException(f"{filename}: {e}") from e
+
+
+def _convert_batch(
+    filenames, output_dir, output_template, title, split, jobs, profile, kwargs
+):
+    """
+    Convert all the schema files found to an output directory.
+    """
+
+    schema_files = find_schema_files(filenames)
+    if not schema_files:
+        raise click.UsageError("No schema files found.")
+
+    converter = jsonschema_restructuredtext.Converter(**kwargs)
+
+    start = time.perf_counter()
+    cache_hits = cache_misses = 0
+    failed = 0
+    total = RenderStats()
+    file_stats = {}
+    try:
+        for result in convert_files(
+            converter,
+            schema_files,
+            output_dir,
+            output_template,
+            title,
+            jobs,
+            profile=bool(profile),
+            split=split,
+        ):
+            if result.error is not None:
+                failed += 1
+                click.echo(f"{result.source}: {result.error}", err=True)
+                continue
+            cache_hits += result.cache_hits
+            cache_misses += result.cache_misses
+            if result.stats is not None:
+                result.stats.add("total", result.seconds)
+                total.merge(result.stats)
+                file_stats[str(result.source)] = result.stats.as_dict()
+            click.echo(
+                f"{result.source} -> {result.destination} ({result.seconds:.3f}s)",
+                err=True,
+            )
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+    seconds = time.perf_counter() - start
+    click.echo(
+        f"Converted {len(schema_files) - failed} files in {seconds:.3f}s", err=True
+    )
+    if converter.cache:
+        click.echo(f"Cache: {cache_hits} hits, {cache_misses} misses", err=True)
+
+    if profile:
+        summary = total.as_dict()
+        summary["phases"]["total"] = {"seconds": seconds, "calls": 1}
+        _write_profile(profile, {"total": summary, "files": file_stats})
+
+    if failed:
+        raise click.ClickException(
+            f"{failed} of {len(schema_files)} files could not be converted."
+        )
+
+
+def _write_profile(path, data):
+    """
+    Write profiling data to a JSON file.
+    """
+
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+    except OSError as e:
+        raise click.ClickException(str(e)) from e
+
+
+def _check_template(template, fields, option):
+    if template is None:
+        return
+    try:
+        check_template(template, fields)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint=f"'{option}'") from e
+
+
+def _watch(filenames, output_dir, output_template, title, split, interval, kwargs):
+    """
+    Convert the schema files found to an output directory whenever they change.
+    """
+
+    converter = jsonschema_restructuredtext.Converter(**kwargs)
+    watcher = Watcher(converter, filenames, output_dir, output_template, title, split)
+
+    def report(result):
+        click.echo(
+            f"{result.source} -> {result.destination} ({result.seconds:.3f}s, "
+            f"cache: {result.cache_hits} hits, {result.cache_misses} misses)",
+            err=True,
+        )
+
+    click.echo(
+        f"Watching for changes every {interval}s, press Ctrl+C to stop.", err=True
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        watcher.run(interval, report)
+
+
+@cli.command()
+@click.option(
+    "-t",
+    "--title",
+    type=str,
+    help="Title of the documents of schemas without one, unless the request "
+    "gives one with the 'title' query parameter.",
+)
+@click.option(
+    "--host",
+    default=DEFAULT_HOST,
+    show_default=True,
+    help="Address to listen on.",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=DEFAULT_PORT,
+    show_default=True,
+    help="Port to listen on, 0 for any free port.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Listen on this Unix socket instead of --host and --port.",
+)
+@converter_options
+@cache_max_size_option
+@debug_option
+def serve(
+    title,
+    host,
+    port,
+    socket_path,
+    resolve,
+    suppress_undocumented,
+    section_punctuation,
+    max_depth,
+    property_order,
+    cache_max_size,
+    debug,
+):
+    """
+    Render schemas sent over HTTP with a converter kept in memory.
+
+    POST a JSON schema to /render, or a YAML one with a YAML content type, to
+    get its reStructuredText. The 'title' query parameter sets the title of the
+    document. Requests are handled concurrently, and the parsed schemas and
+    rendered documents and definitions are kept in memory. GET /health
+    answers once the server is up.
+    """
+
+    from jsonschema_restructuredtext.server import RenderService, make_server
+
+    configure_logging(debug)
+
+    converter = jsonschema_restructuredtext.Converter(
+        title=title or "JSON Schema",
+        replace_refs=resolve,
+        suppress_undocumented=suppress_undocumented,
+        section_punctuation=section_punctuation,
+        max_depth=max_depth,
+        property_order=property_order,
+        debug=debug,
+        cache=MemoryCache(cache_max_size * 1024 * 1024),
+    )
+
+    try:
+        server = make_server(RenderService(converter), host, port, socket_path)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
 
-    # Convert the file contents to restructuredtext
-    rst = jsonschema_restructuredtext.generate(file_contents, **kwargs)
+    if socket_path:
+        click.echo(f"Serving on {socket_path}", err=True)
+    else:
+        host, port = server.server_address[:2]
+        click.echo(f"Serving on http://{host}:{port}", err=True)
 
-    # Output the restructuredtext
-    click.echo(rst, nl=False)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,196 @@
+from typing import Optional
+
+
+class _Record:
+    """
+    Base of the plan classes, compared and printed by the values of their
+    `__slots__`.
+
+    Slots avoid an instance `__dict__`, which matters for the rows of wide
+    schemas. `dataclass(slots=True)` needs Python 3.10, hence the manual
+    implementation.
+    """
+
+    __slots__ = ()
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class Table(_Record):
+    """
+    The properties of a schema, with their details and nested tables.
+
+    `text` replaces the table for enum and const schemas. `rows` is empty for
+    schemas without properties.
+    """
+
+    __slots__ = ("title", "json_path", "level", "text", "closed", "rows")
+
+    def __init__(
+        self,
+        title: str,
+        json_path: list,
+        level: int,
+        text: Optional[str] = None,
+        closed: bool = False,
+        rows: Optional[list] = None,
+    ) -> None:
+        self.title = title
+        self.json_path = json_path
+        self.level = level
+        self.text = text
+        self.closed = closed
+        self.rows = [] if rows is None else rows
+
+
+class DetailBlock(_Record):
+    """
+    The formatted values of the details of a property, below its table.
+
+    A nested object or array either has a `nested` table, a `reference` to the
+    label and anchor of the section it is rendered in, or the `depth_limit` it
+    reached.
+    """
+
+    __slots__ = (
+        "description",
+        "deprecated",
+        "default",
+        "possible_values",
+        "examples",
+        "nested",
+        "reference",
+        "depth_limit",
+    )
+
+    def __init__(
+        self,
+        description: str,
+        deprecated: bool = False,
+        default: Optional[str] = None,
+        possible_values: str = "",
+        examples: str = "",
+        nested: Optional[Table] = None,
+        reference: Optional[tuple] = None,
+        depth_limit: Optional[int] = None,
+    ) -> None:
+        self.description = description
+        self.deprecated = deprecated
+        self.default = default
+        self.possible_values = possible_values
+        self.examples = examples
+        self.nested = nested
+        self.reference = reference
+        self.depth_limit = depth_limit
+
+
+class PropertyRow(_Record):
+    """
+    A property of a table, with the formatted values of its row and its
+    `detail`.
+    """
+
+    __slots__ = ("name", "anchor", "type", "required", "summary", "detail")
+
+    def __init__(
+        self,
+        name: str,
+        anchor: str,
+        type: str,
+        required: str,
+        summary: str,
+        detail: DetailBlock,
+    ) -> None:
+        self.name = name
+        self.anchor = anchor
+        self.type = type
+        self.required = required
+        self.summary = summary
+        self.detail = detail
+
+
+class Section(_Record):
+    """
+    A section of the document, the root schema or a definition.
+
+    `key` identifies the content the section was compiled from, `None` if the
+    schema cannot be hashed.
+    """
+
+    __slots__ = (
+        "label",
+        "anchor",
+        "heading",
+        "underline",
+        "description",
+        "type",
+        "table",
+        "key",
+    )
+
+    def __init__(
+        self,
+        label: str,
+        anchor: str,
+        heading: str,
+        underline: str,
+        description: str,
+        type: str,
+        table: Table,
+        key: Optional[str] = None,
+    ) -> None:
+        self.label = label
+        self.anchor = anchor
+        self.heading = heading
+        self.underline = underline
+        self.description = description
+        self.type = type
+        self.table = table
+        self.key = key
+
+
+class RenderPlan(_Record):
+    """
+    The analysed structure of a document, before it is formatted.
+
+    Created by `compile_schema()` and turned into reStructuredText by
+    `render_plan()`. A plan can be rendered several times, kept and passed as
+    `previous` when compiling a new version of the schema, so that unchanged
+    sections are reused instead of analysed again.
+    """
+
+    __slots__ = ("title", "sections")
+
+    def __init__(self, title: str, sections: list) -> None:
+        self.title = title
+        self.sections = sections
+
+    def changed_sections(self, previous: "RenderPlan") -> list:
+        """
+        List the labels of the sections that differ from `previous`, or are
+        not in it.
+        """
+        before = {section.label: section for section in previous.sections}
+        changed = []
+        for section in self.sections:
+            old = before.get(section.label)
+            if old is None:
+                changed.append(section.label)
+            elif section.key is not None and old.key is not None:
+                if section.key != old.key:
+                    changed.append(section.label)
+            elif section != old:
+                changed.append(section.label)
+        return changed
@@ -0,0 +1,224 @@
+import urllib.parse
+from collections.abc import Mapping
+from typing import Optional
+
+DEFINITION_KEYS = ("$defs", "definitions")
+
+
+def resolve_refs(schema: Mapping) -> dict:
+    """
+    Return a copy of the schema with `$ref` pointers replaced by their targets.
+
+    References are resolved through an index of the `$defs`/`definitions`
+    entries, `$id` and `$anchor` values built once, other JSON pointers are
+    looked up in the document. As with `jsonref.replace_refs`, keywords next to
+    `$ref` are dropped.
+
+    The schema is not modified, and can be made of read-only mappings and
+    tuples. The copy is made of plain dicts and lists. A subschema referenced
+    from several places is copied once and shared, so recursive schemas become
+    cyclic data structures instead of expanding without limit. References that
+    cannot be resolved, such as remote ones or cycles made only of references,
+    are left in place.
+    """
+    return _Resolver(schema).resolve()
+
+
+def referenced_definitions(node, defs: Mapping) -> Optional[set]:
+    """
+    Get the names of the definitions `node` references, directly or not.
+
+    Returns `None` when a reference points anywhere else than a definition,
+    as what the node depends on is then unknown.
+    """
+    names = set()
+    seen = set()
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+
+        if isinstance(node, Mapping):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                name = _definition_name(ref)
+                if name is None or name not in defs:
+                    return None
+                if name not in names:
+                    names.add(name)
+                    stack.append(defs[name])
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+
+    return names
+
+
+def _definition_name(ref: str) -> Optional[str]:
+    """
+    Get the name of the definition a reference points to, if it is one.
+    """
+    for key in DEFINITION_KEYS:
+        prefix = f"#/{key}/"
+        if ref.startswith(prefix) and "/" not in ref[len(prefix) :]:
+            return ref[len(prefix) :].replace("~1", "/").replace("~0", "~")
+    return None
+
+
+class _Resolver:
+    def __init__(self, schema: Mapping) -> None:
+        self.schema = schema
+        self.base_uri = _base_uri(schema.get("$id"), "")
+
+        # Subschemas that can be referenced directly, keyed by URI or pointer
+        self.index: dict = {}
+        # The base URI of the references outside the root resource, keyed by
+        # identity of the mapping holding them
+        self.bases: dict = {}
+        # Copies of the mappings, keyed by identity of the original
+        self.copies: dict = {}
+
+        self._index(schema, "#", self.base_uri)
+
+    def resolve(self) -> dict:
+        return self._copy(self.schema)
+
+    def _index(self, node, pointer: str, base_uri: str) -> None:
+        """
+        Index the definitions, `$id` and `$anchor` values below `node`.
+        """
+        if isinstance(node, Mapping):
+            if isinstance(node.get("$id"), str):
+                base_uri = _base_uri(node["$id"], base_uri)
+                self.index.setdefault(base_uri, node)
+            if isinstance(node.get("$anchor"), str):
+                self.index.setdefault(f"{base_uri}#{node['$anchor']}", node)
+            if base_uri != self.base_uri and isinstance(node.get("$ref"), str):
+                self.bases[id(node)] = base_uri
+
+            for key, value in node.items():
+                child_pointer = f"{pointer}/{_escape_pointer_token(key)}"
+                if key in DEFINITION_KEYS and isinstance(value, Mapping):
+                    for name, definition in value.items():
+                        name_pointer = f"{child_pointer}/{_escape_pointer_token(name)}"
+                        self.index[name_pointer] = definition
+                self._index(value, child_pointer, base_uri)
+
+        elif isinstance(node, (list, tuple)):
+            for i, value in enumerate(node):
+                self._index(value, f"{pointer}/{i}", base_uri)
+
+    def _lookup(self, ref: str, base_uri: str) -> Optional[object]:
+        """
+        Find the subschema a reference points to, `None` if there is none.
+
+        The reference is relative to `base_uri`, the URI of the resource it
+        is in, that is the closest `$id` above it.
+        """
+        # The pointers of the index are relative to the root resource
+        if base_uri == self.base_uri and ref in self.index:
+            return self.index[ref]
+
+        uri, _, fragment = urllib.parse.urljoin(base_uri, ref).partition("#")
+        if uri == self.base_uri:
+            document = self.schema
+        elif uri in self.index:
+            document = self.index[uri]
+        else:
+            return None
+
+        if not fragment:
+            return document
+        if not fragment.startswith("/"):
+            return self.index.get(f"{uri}#{fragment}")
+        return _walk_pointer(document, urllib.parse.unquote(fragment))
+
+    def _follow(self, node: Mapping):
+        """
+        Follow a chain of references, returning `node` if it cannot be resolved.
+        """
+        seen = set()
+        target = node
+        while isinstance(target, Mapping) and isinstance(target.get("$ref"), str):
+            if id(target) in seen:
+                return node
+            seen.add(id(target))
+
+            base_uri = self.bases.get(id(target), self.base_uri)
+            target = self._lookup(target["$ref"], base_uri)
+            if target is None:
+                return node
+        return target
+
+    def _copy(self, node):
+        # Iterative, as chains of references can be deeper than the recursion limit
+        copy, stack = self._copy_shell(node)
+        while stack:
+            container, key, value = stack.pop()
+            container[key], children = self._copy_shell(value)
+            stack.extend(children)
+        return copy
+
+    def _copy_shell(self, node) -> tuple:
+        """
+        Copy `node` without its children, listing the children left to copy.
+
+        The children are `(container, key, value)` tuples, where the copy of
+        `value` goes to `container[key]`.
+        """
+        if isinstance(node, Mapping):
+            node = self._follow(node)
+
+        if isinstance(node, Mapping):
+            if id(node) in self.copies:
+                return self.copies[id(node)], []
+
+            # Register the copy before filling it, so that recursive
+            # references end up pointing to it
+            copy = self.copies[id(node)] = dict.fromkeys(node)
+            return copy, [(copy, key, value) for key, value in node.items()]
+
+        if isinstance(node, (list, tuple)):
+            copy = [None] * len(node)
+            return copy, [(copy, i, value) for i, value in enumerate(node)]
+
+        return node, []
+
+
+def _base_uri(uri: Optional[str], base_uri: str) -> str:
+    """
+    Resolve `uri` against `base_uri`, without the fragment.
+    """
+    if not uri:
+        return base_uri
+    return urllib.parse.urljoin(base_uri, uri).partition("#")[0]
+
+
+def _escape_pointer_token(token: str) -> str:
+    """
+    Escape a key for use as a JSON pointer token.
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _walk_pointer(document, pointer: str):
+    """
+    Resolve a JSON pointer in a document, `None` if it does not exist.
+    """
+    node = document
+    for token in pointer.split("/")[1:]:
+        token = token.replace("~1", "/").replace("~0", "~")
+        if isinstance(node, Mapping) and token in node:
+            node = node[token]
+        elif (
+            isinstance(node, (list, tuple))
+            and token.isdigit()
+            and int(token) < len(node)
+        ):
+            node = node[int(token)]
+        else:
+            return None
+    return node
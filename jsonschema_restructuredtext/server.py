@@ -0,0 +1,209 @@
+import contextlib
+import hashlib
+import os
+import socketserver
+import threading
+import urllib.parse
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Optional
+
+from jsonschema_restructuredtext.constants import DEFAULT_HOST, DEFAULT_PORT
+from jsonschema_restructuredtext.loaders import check_schema, load_json, load_yaml
+
+if TYPE_CHECKING:
+    from jsonschema_restructuredtext.converter.rst import Converter
+
+DEFAULT_MAX_SCHEMAS = 128
+
+
+class RenderService:
+    """
+    Render schemas sent as JSON or YAML documents with a long-lived converter.
+
+    The last `max_schemas` parsed schemas are kept, keyed by the hash of their
+    document, so sending the same document again does not parse it. Give the
+    converter a `MemoryCache` to keep the rendered documents, and to reuse the
+    sections of the definitions that did not change between two versions of
+    a schema.
+    """
+
+    def __init__(
+        self, converter: "Converter", max_schemas: int = DEFAULT_MAX_SCHEMAS
+    ) -> None:
+        self.converter = converter
+        self.max_schemas = max_schemas
+
+        self._lock = threading.Lock()
+        self._schemas = OrderedDict()
+
+    def render(
+        self, document: bytes, title: Optional[str] = None, yaml: bool = False
+    ) -> tuple:
+        """
+        Render a schema document, as JSON or as YAML.
+
+        Returns the reStructuredText and whether it was in the cache of the
+        converter. Raises `ValueError` if the document is not a valid schema.
+        """
+        digest = hashlib.sha256(document).hexdigest()
+        schema = self._parse(digest, document, yaml)
+
+        return self.converter.generate_cached(schema, title)
+
+    def _parse(self, digest: str, document: bytes, yaml: bool) -> dict:
+        """
+        Parse a document, or get it from the last parsed schemas.
+        """
+        with self._lock:
+            schema = self._schemas.get((digest, yaml))
+            if schema is not None:
+                self._schemas.move_to_end((digest, yaml))
+                return schema
+
+        schema = check_schema(load_yaml(document) if yaml else load_json(document))
+
+        with self._lock:
+            self._schemas[(digest, yaml)] = schema
+            while len(self._schemas) > self.max_schemas:
+                self._schemas.popitem(last=False)
+        return schema
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handle the requests of a render server.
+
+    `POST /render` renders the schema in the body, as YAML if the content type
+    mentions it and as JSON otherwise. The `title` query parameter replaces
+    the title of the converter. `GET /health` tells whether the server is up.
+    """
+
+    server_version = "jsonschema-restructuredtext"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if urllib.parse.urlsplit(self.path).path != "/health":
+            self._send(404, "Not found\n")
+            return
+        self._send(200, "OK\n")
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The end of the body is unknown, so is the next request
+            self.close_connection = True
+            self._send(
+                411, "Content-Length required\n", headers={"Connection": "close"}
+            )
+            return
+        # Read before any other answer, or the body would be taken for the
+        # next request on the connection
+        document = self.rfile.read(length)
+
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/render":
+            self._send(404, "Not found\n")
+            return
+
+        title = urllib.parse.parse_qs(url.query).get("title", [None])[0]
+        yaml = "yaml" in self.headers.get("Content-Type", "")
+
+        service = self.server.service
+        try:
+            rst, cached = service.render(document, title, yaml)
+        except ValueError as e:
+            self._send(400, f"Invalid schema: {e}\n")
+            return
+        except Exception as e:
+            service.converter.logger.exception("Cannot render the schema")
+            self._send(500, f"Cannot render the schema: {e}\n")
+            return
+
+        self._send(200, rst, "text/x-rst", {"X-Cache": "hit" if cached else "miss"})
+
+    def _send(
+        self,
+        status: int,
+        text: str,
+        content_type: str = "text/plain",
+        headers: Optional[dict] = None,
+    ) -> None:
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Clients of a Unix socket have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        self.server.service.converter.logger.debug(
+            "{} {}", self.address_string(), format % args
+        )
+
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    """
+    Render server on a TCP socket, handling each request in a thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, service: RenderService) -> None:
+        self.service = service
+        super().__init__(address, RenderRequestHandler)
+
+
+# Unix sockets are not available on every platform
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class RenderUnixServer(socketserver.ThreadingUnixStreamServer):
+        """
+        Render server on a Unix socket, handling each request in a thread.
+
+        The socket file is removed when the server is closed, unless it could not
+        be bound, which happens when the file already exists.
+        """
+
+        daemon_threads = True
+
+        def __init__(self, path: str, service: RenderService) -> None:
+            self.service = service
+            self._bound = False
+            super().__init__(path, RenderRequestHandler)
+
+        def server_bind(self) -> None:
+            super().server_bind()
+            self._bound = True
+
+        def server_close(self) -> None:
+            super().server_close()
+            if self._bound:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(self.server_address)
+
+
+def make_server(
+    service: RenderService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    Create a render server listening on `socket_path` if given, on `host` and
+    `port` otherwise.
+    """
+    if socket_path is not None:
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise ValueError("Unix sockets are not supported on this platform")
+        return RenderUnixServer(socket_path, service)
+    return RenderHTTPServer((host, port), service)
@@ -0,0 +1,210 @@
+"""
+Sphinx extension rendering JSON schemas inside the documentation build.
+
+Add `jsonschema_restructuredtext.sphinxext` to the `extensions` of `conf.py`
+and write `.. jsonschema-rst:: path/to/schema.json` where a schema should be
+documented. The path is relative to the document, or to the source directory
+when it starts with `/`. The `jsonschema_rst_options` setting holds the
+default options of the converter, such as `property_order`.
+
+The compiled schemas are kept in the build environment, keyed by file and by
+options. A schema is only parsed and compiled again when its content changes,
+so editing the document around it, or touching the file, does not. The nodes
+of a compiled schema are built directly into the document, without writing
+and parsing reStructuredText.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+from docutils.parsers.rst import directives
+from sphinx.util.docutils import SphinxDirective
+
+from jsonschema_restructuredtext.cache import (
+    cache_key,
+    function_name,
+    package_version,
+)
+from jsonschema_restructuredtext.constants import PROPERTY_ORDERS
+from jsonschema_restructuredtext.converter.doctree import render_plan_nodes
+from jsonschema_restructuredtext.converter.rst import Converter
+from jsonschema_restructuredtext.loaders import check_schema, get_loader
+from jsonschema_restructuredtext.plan import RenderPlan
+
+# Bumped when the compiled schemas kept in the environment change format
+ENV_VERSION = 2
+
+# The converters of each set of options, created on first use
+_converters = {}
+
+
+def property_order(argument: str) -> tuple:
+    """
+    Parse the `property-order` option, orders separated by commas or spaces.
+    """
+    order = tuple(argument.replace(",", " ").split())
+    unknown = set(order) - set(PROPERTY_ORDERS)
+    if unknown:
+        raise ValueError(f"Unknown property order: {', '.join(sorted(unknown))}")
+    return order
+
+
+class JsonSchemaDirective(SphinxDirective):
+    """
+    Render a JSON or YAML schema file as reStructuredText.
+    """
+
+    required_arguments = 1
+    option_spec = {
+        "title": directives.unchanged_required,
+        "replace-refs": directives.flag,
+        "suppress-undocumented": directives.flag,
+        "max-depth": directives.nonnegative_int,
+        "property-order": property_order,
+    }
+
+    def run(self) -> list:
+        relative, path = self.env.relfn2path(self.arguments[0], self.env.docname)
+        # The document is read again when the schema changes
+        self.env.note_dependency(relative)
+
+        try:
+            plan = compile_schema_file(
+                self.env, relative, path, self.converter_options()
+            )
+        except (OSError, ValueError) as e:
+            raise self.error(f"Cannot render {self.arguments[0]}: {e}") from e
+
+        return render_plan_nodes(plan, self.state.document)
+
+    def converter_options(self) -> dict:
+        """
+        Get the options of the converter, the directive's over the defaults.
+        """
+        options = dict(self.config.jsonschema_rst_options)
+        if "title" in self.options:
+            options["title"] = self.options["title"]
+        if "replace-refs" in self.options:
+            options["replace_refs"] = True
+        if "suppress-undocumented" in self.options:
+            options["suppress_undocumented"] = True
+        if "max-depth" in self.options:
+            options["max_depth"] = self.options["max-depth"]
+        if "property-order" in self.options:
+            options["property_order"] = self.options["property-order"]
+        return options
+
+
+def compile_schema_file(env, relative: str, path: str, options: dict) -> RenderPlan:
+    """
+    Compile a schema file, or get it from the build environment.
+
+    A file whose modification time and size did not change is not read. One
+    that did is hashed, and only parsed and compiled if its content changed.
+    """
+    schemas = _schemas(env)
+    options_key = _options_key(options)
+    key = (relative, options_key)
+
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    entry = schemas.get(key) if options_key is not None else None
+    if entry is None or entry["version"] != version:
+        with open(path, "rb") as f:
+            document = f.read()
+        digest = hashlib.sha256(document).hexdigest()
+
+        if entry is None or entry["digest"] != digest:
+            schema = check_schema(get_loader(path)(document))
+            entry = {
+                "digest": digest,
+                "plan": _converter(options, options_key).compile(schema),
+                "docnames": set(),
+            }
+        entry["version"] = version
+
+        if options_key is not None:
+            schemas[key] = entry
+
+    entry["docnames"].add(env.docname)
+    return entry["plan"]
+
+
+def _schemas(env) -> dict:
+    """
+    Get the compiled schemas of the build environment, keyed by the path of
+    their file and the key of their options.
+    """
+    if not hasattr(env, "jsonschema_rst_schemas"):
+        env.jsonschema_rst_schemas = {}
+    return env.jsonschema_rst_schemas
+
+
+def _options_key(options: dict) -> Optional[str]:
+    """
+    Get a stable key of the options of a converter, `None` if a `documented`
+    predicate has no importable name to identify it with.
+    """
+    options = dict(options)
+    documented = options.pop("documented", None)
+    if documented is not None:
+        name = function_name(documented)
+        if name is None:
+            return None
+        options["documented"] = name
+    return cache_key(package_version(), options)
+
+
+def _converter(options: dict, options_key: Optional[str]) -> Converter:
+    if options_key is None:
+        return Converter(**options)
+    converter = _converters.get(options_key)
+    if converter is None:
+        converter = _converters[options_key] = Converter(**options)
+    return converter
+
+
+def purge_doc(app, env, docname: str) -> None:
+    for entry in _schemas(env).values():
+        entry["docnames"].discard(docname)
+
+
+def merge_info(app, env, docnames: set, other) -> None:
+    """
+    Merge the schemas compiled by a parallel reader, keeping the newest file
+    when both compiled it.
+    """
+    schemas = _schemas(env)
+    for key, entry in _schemas(other).items():
+        current = schemas.get(key)
+        if current is not None:
+            if current["version"] > entry["version"]:
+                current["docnames"] |= entry["docnames"]
+                continue
+            entry["docnames"] |= current["docnames"]
+        schemas[key] = entry
+
+
+def env_updated(app, env) -> list:
+    """
+    Drop the schemas no document renders anymore.
+    """
+    schemas = _schemas(env)
+    for key in [key for key, entry in schemas.items() if not entry["docnames"]]:
+        del schemas[key]
+    return []
+
+
+def setup(app) -> dict:
+    app.add_config_value("jsonschema_rst_options", {}, "env", [dict])
+    app.add_directive("jsonschema-rst", JsonSchemaDirective)
+    app.connect("env-purge-doc", purge_doc)
+    app.connect("env-merge-info", merge_info)
+    app.connect("env-updated", env_updated)
+    return {
+        "version": package_version(),
+        "env_version": ENV_VERSION,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
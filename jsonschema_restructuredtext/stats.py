@@ -0,0 +1,132 @@
+import contextlib
+import heapq
+import time
+from typing import Callable, Iterable, Iterator
+
+DEFAULT_SLOWEST = 10
+
+
+class RenderStats:
+    """
+    Time and call counts of the phases of conversions.
+
+    Filled in by `generate()` and `Converter` when given, and by the CLI with
+    `--profile`. Phases nest: `render` is the time spent generating the
+    document, which includes the `sort_properties` and `property_details`
+    phases, while `load`, `resolve_refs`, `cache` and `write` happen outside
+    of it. Each definition section and the `slowest` properties are also
+    timed, a property without its nested tables.
+    """
+
+    def __init__(self, slowest: int = DEFAULT_SLOWEST) -> None:
+        self.slowest = slowest
+        # Seconds and calls, keyed by phase name or definition key
+        self.phases = {}
+        self.definitions = {}
+        self.counts = {}
+
+        # Heap of the slowest properties, as (seconds, path) tuples
+        self._properties = []
+
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        """
+        Add the time of calls to a phase.
+        """
+        _add(self.phases, phase, seconds, calls)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Increase a counter.
+        """
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def add_definition(self, key: str, seconds: float, calls: int = 1) -> None:
+        """
+        Add the time of rendering the section of a definition.
+        """
+        _add(self.definitions, key, seconds, calls)
+
+    def add_property(self, path: str, seconds: float) -> None:
+        """
+        Add the time of a property, keeping it if it is one of the slowest.
+        """
+        if self.slowest <= 0:
+            return
+        if len(self._properties) < self.slowest:
+            heapq.heappush(self._properties, (seconds, path))
+        elif seconds > self._properties[0][0]:
+            heapq.heapreplace(self._properties, (seconds, path))
+
+    @contextlib.contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """
+        Time a block of code as one call to a phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def merge(self, other: "RenderStats") -> None:
+        """
+        Add the measurements of another instance, from a worker process for
+        instance.
+        """
+        for phase, (seconds, calls) in other.phases.items():
+            self.add(phase, seconds, calls)
+        for key, (seconds, calls) in other.definitions.items():
+            self.add_definition(key, seconds, calls)
+        for name, n in other.counts.items():
+            self.count(name, n)
+        for seconds, path in other._properties:
+            self.add_property(path, seconds)
+
+    def as_dict(self) -> dict:
+        """
+        Return the measurements as JSON serializable data.
+        """
+        return {
+            "phases": _as_dict(self.phases),
+            "counts": dict(sorted(self.counts.items())),
+            "definitions": _as_dict(self.definitions),
+            "slowest_properties": [
+                {"path": path, "seconds": seconds}
+                for seconds, path in sorted(self._properties, reverse=True)
+            ],
+        }
+
+
+def timed(chunks: Iterable, record: Callable[[float], None]) -> Iterator:
+    """
+    Yield the chunks, passing the time spent producing them to `record`.
+
+    The time the consumer spends between chunks is not included.
+    """
+    iterator = iter(chunks)
+    seconds = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - start
+            yield chunk
+    finally:
+        record(seconds)
+
+
+def _add(entries: dict, name: str, seconds: float, calls: int) -> None:
+    entry = entries.setdefault(name, [0.0, 0])
+    entry[0] += seconds
+    entry[1] += calls
+
+
+def _as_dict(entries: dict) -> dict:
+    return {
+        name: {"seconds": seconds, "calls": calls}
+        for name, (seconds, calls) in entries.items()
+    }
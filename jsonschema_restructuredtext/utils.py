@@ -1,4 +1,11 @@
+import contextlib
+import functools
+import os
 import re
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, TextIO
 
 def create_section(punc: str, anchor: str, header: str) -> str:
     """
@@ -31,40 +38,128 @@ def create_const(schema: dict) -> str:
     return f"**Possible Values:** {schema.get('const', '?')}\n\n"
 
 
-def sort_properties(schema: dict) -> dict:
+def is_documented(schema) -> bool:
     """
-    Sort the properties in the schema by required, making the deprecated properties last.
+    Whether a schema has a title, a description or examples.
     """
-    properties = schema["properties"]
+    return any(schema.get(k) for k in ["title", "description", "examples"])
 
-    # Sort the properties by required
-    properties = dict(
-        sorted(
-            properties.items(),
-            key=lambda item: item[0] not in schema.get("required", []),
-        )
+
+# Descriptions marking a property as deprecated
+DEPRECATED_PATTERN = re.compile(r"\[deprecated\]", re.IGNORECASE)
+
+
+def is_deprecated(details) -> bool:
+    """
+    Whether a property is deprecated, by its deprecated key or a "[deprecated]"
+    mark in its description.
+    """
+    return bool(details.get("deprecated", False)) or bool(
+        DEPRECATED_PATTERN.search(str(details.get("description", "")))
     )
 
-    # Sort the properties by deprecated
-    properties = dict(
+
+def sort_properties(schema: dict, order: Sequence[str] = ()) -> dict:
+    """
+    Sort the properties in the schema by the criteria in `order`, the first one
+    taking precedence, and keep the source order otherwise.
+
+    The criteria are "required" for the required properties first,
+    "deprecated" for the deprecated properties last and "alphabetical" for
+    the names. The properties are in source order by default, as with
+    `generate`.
+    """
+    properties = schema["properties"]
+    if not order:
+        return properties
+
+    required = set(schema.get("required", ()))
+    criteria = {
+        "required": lambda name, details: name not in required,
+        "deprecated": lambda name, details: is_deprecated(details),
+        "alphabetical": lambda name, details: name,
+    }
+    keys = [criteria[criterion] for criterion in order]
+
+    # A single stable sort on a tuple of all the criteria
+    return dict(
         sorted(
             properties.items(),
-            key=lambda item: "[deprecated]"
-            in str(item[1].get("description", "")).lower()
-            or item[1].get("deprecated", False),
+            key=lambda item: tuple(key(*item) for key in keys),
         )
     )
 
-    return properties
+# Text between backticks, without its leading and trailing spaces. `.` does not
+# match newlines, so neither do the spaces.
+BACKTICKS_PATTERN = re.compile(r"`[^\S\n]*(.*?)[^\S\n]*`")
+
+# Characters replaced with dashes in anchors
+DASHES = str.maketrans("_ ", "--")
+
 
 def strip_inside_backticks(text):
     """
     Remove leading and trailing spaces inside backticks.
     """
-    return re.sub(r'`(.*?)`', lambda match: f"`{match.group(1).strip()}`", text)
+    if "`" not in text:
+        return text
+    # A callback, as a template such as r"`\1`" is expanded by Python code for
+    # every match before Python 3.12
+    return BACKTICKS_PATTERN.sub(_strip_backticks_match, text)
+
 
+def _strip_backticks_match(match):
+    return f"`{match.group(1)}`"
+
+
+def to_json(value):
+    """
+    Convert read-only mappings, such as `MappingProxyType`, for `json.dumps`.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+@functools.lru_cache(maxsize=8192)
 def dashify(text):
     """
     Replace spaces and underscores with dashes and make lowercase.
     """
-    return re.sub(r'[_ ]', '-', text).lower()
+    return text.translate(DASHES).lower()
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write text to a file atomically, unless it already holds that text.
+
+    Returns whether the file was written.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    with atomic_open(path) as f:
+        f.write(text)
+    return True
+
+
+@contextlib.contextmanager
+def atomic_open(path: Path, newline: Optional[str] = None) -> Iterator[TextIO]:
+    """
+    Open a temporary text file to write the content of `path`.
+
+    The file replaces `path` when the block exits, and is deleted instead if
+    the block raises, so `path` never holds a partial content.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
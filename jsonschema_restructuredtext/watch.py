@@ -0,0 +1,123 @@
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+from jsonschema_restructuredtext.batch import (
+    DEFAULT_OUTPUT_TEMPLATE,
+    ConversionResult,
+    convert_file,
+    find_schema_files,
+    output_path,
+    schema_title,
+)
+from jsonschema_restructuredtext.loaders import load_schema
+
+if TYPE_CHECKING:
+    from jsonschema_restructuredtext.converter.rst import Converter
+
+DEFAULT_INTERVAL = 1.0
+
+
+class Watcher:
+    """
+    Convert schema files again whenever they change.
+
+    The inputs are expanded like in batch mode on every poll, so files added
+    to a watched directory are picked up. A file is only loaded again when its
+    modification time or size changed, and only converted again when its
+    content did. Giving the converter a cache, such as a `MemoryCache`, also
+    skips the definitions that did not change.
+    """
+
+    def __init__(
+        self,
+        converter: "Converter",
+        inputs: Iterable[str],
+        output_dir: Path,
+        template: str = DEFAULT_OUTPUT_TEMPLATE,
+        title: Optional[str] = None,
+        split: bool = False,
+    ) -> None:
+        self.converter = converter
+        self.inputs = list(inputs)
+        self.output_dir = output_dir
+        self.template = template
+        self.title = title
+        self.split = split
+
+        # The modification time and size of each file, and its loaded schema
+        self._stamps = {}
+        self._schemas = {}
+
+    def poll(self) -> list:
+        """
+        Convert the schema files that changed since the previous poll.
+
+        Files that cannot be loaded or converted are logged and tried again
+        once they change.
+        """
+        results = []
+        seen = set()
+
+        for schema_file in find_schema_files(self.inputs):
+            path = schema_file.path
+            seen.add(path)
+
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if self._stamps.get(path) == stamp:
+                continue
+            self._stamps[path] = stamp
+
+            try:
+                schema = load_schema(path)
+            except (OSError, ValueError) as e:
+                self._schemas.pop(path, None)
+                self.converter.logger.error("Cannot load {}: {}", path, e)
+                continue
+            if path in self._schemas and self._schemas[path] == schema:
+                continue
+
+            destination = output_path(schema_file, self.output_dir, self.template)
+            try:
+                result = convert_file(
+                    self.converter,
+                    path,
+                    destination,
+                    schema_title(schema_file, self.title),
+                    schema,
+                    split=self.split,
+                )
+            except (OSError, ValueError) as e:
+                self._schemas.pop(path, None)
+                self.converter.logger.error("Cannot convert {}: {}", path, e)
+                continue
+            results.append(result)
+
+            self._schemas[path] = schema
+
+        # Forget the files that are gone, they are converted again if they return
+        for path in set(self._stamps) - seen:
+            del self._stamps[path]
+            self._schemas.pop(path, None)
+
+        return results
+
+    def run(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        callback: Optional[Callable[[ConversionResult], None]] = None,
+    ) -> None:
+        """
+        Poll the schema files every `interval` seconds until interrupted.
+
+        `callback` is called with the result of every conversion.
+        """
+        while True:
+            for result in self.poll():
+                if callback is not None:
+                    callback(result)
+            time.sleep(interval)
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from jsonschema_restructuredtext import (
+    Converter,
+    agenerate_many,
+    generate,
+    generate_async,
+    generate_async_iter,
+)
+from tests.model import Car
+
+SCHEMA = Car.model_json_schema()
+
+
+def collect(iterator):
+    async def main():
+        return [item async for item in iterator]
+
+    return asyncio.run(main())
+
+
+def test_generate_async():
+    assert asyncio.run(generate_async(SCHEMA, title="Car")) == generate(
+        SCHEMA, title="Car"
+    )
+
+
+def test_generate_async_iter_chunks():
+    chunks = collect(generate_async_iter(SCHEMA, chunk_size=1))
+    assert len(chunks) > 1
+    assert "".join(chunks) == generate(SCHEMA)
+
+
+def test_generate_async_with_converter():
+    converter = Converter(title="Title")
+    assert asyncio.run(generate_async(SCHEMA, converter=converter)) == generate(
+        SCHEMA, title="Title"
+    )
+    with pytest.raises(TypeError):
+        asyncio.run(generate_async(SCHEMA, converter=converter, debug=True))
+
+
+def test_agenerate_many():
+    schemas = [SCHEMA, {"title": "Empty"}, SCHEMA]
+    results = dict(collect(agenerate_many(schemas, concurrency=2)))
+    assert results == {index: generate(schema) for index, schema in enumerate(schemas)}
+
+
+def test_agenerate_many_async_iterable():
+    async def schemas():
+        for _ in range(3):
+            yield SCHEMA
+
+    results = collect(agenerate_many(schemas()))
+    assert sorted(index for index, _ in results) == [0, 1, 2]
+    assert {rst for _, rst in results} == {generate(SCHEMA)}
+
+
+def test_agenerate_many_backpressure():
+    taken = []
+
+    def schemas():
+        for index in range(10):
+            taken.append(index)
+            yield SCHEMA
+
+    async def main():
+        iterator = agenerate_many(schemas(), concurrency=2)
+        await iterator.__anext__()
+        await iterator.aclose()
+
+    asyncio.run(main())
+    # Only the schemas rendered at the same time and the next ones were taken
+    assert len(taken) <= 3
+
+
+def test_agenerate_many_invalid_concurrency():
+    with pytest.raises(ValueError):
+        collect(agenerate_many([SCHEMA], concurrency=0))
+
+
+def test_executor_must_be_a_thread_pool():
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(TypeError, match="ThreadPoolExecutor"):
+            asyncio.run(generate_async(SCHEMA, executor=executor))
+        with pytest.raises(TypeError, match="ThreadPoolExecutor"):
+            collect(agenerate_many([SCHEMA], executor=executor))
+
+
+def test_cancel_stops_rendering():
+    started = threading.Event()
+    release = threading.Event()
+    rendered = []
+    converter = Converter()
+    generate_iter = converter.generate_iter
+
+    def slow_generate_iter(schema, title=None):
+        for chunk in generate_iter(schema, title):
+            started.set()
+            release.wait(5)
+            rendered.append(chunk)
+            yield chunk
+
+    converter.generate_iter = slow_generate_iter
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            task = asyncio.ensure_future(
+                generate_async(
+                    SCHEMA, executor=executor, chunk_size=1, converter=converter
+                )
+            )
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release.set()
+
+    asyncio.run(main())
+    # Only the chunk being rendered when the task was cancelled is finished
+    assert len(rendered) == 1
+    assert len(list(generate_iter(SCHEMA))) > 1
@@ -0,0 +1,128 @@
+import json
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import generate
+from jsonschema_restructuredtext.main import cli
+
+SCHEMA_EXAMPLES = ["simple.json", "integer.json", "nested_dicts.json"]
+
+
+def copy_examples(directory):
+    for name in SCHEMA_EXAMPLES:
+        shutil.copy(f"tests/schema-examples/{name}", directory / name)
+
+
+def expected_output(path, title):
+    with open(path, "r") as f:
+        return generate(json.load(f), title=title)
+
+
+def test_batch_converts_directory(tmp_path):
+    source = tmp_path / "schemas"
+    (source / "nested").mkdir(parents=True)
+    copy_examples(source / "nested")
+    output = tmp_path / "output"
+
+    result = CliRunner().invoke(cli, [str(source), "--output-dir", str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert f"Converted {len(SCHEMA_EXAMPLES)} files" in result.output
+    for name in SCHEMA_EXAMPLES:
+        stem = name.removesuffix(".json")
+        rst = (output / "nested" / f"{stem}.rst").read_text()
+        assert rst == expected_output(source / "nested" / name, stem)
+
+
+def test_batch_converts_glob_with_template_and_title(tmp_path):
+    copy_examples(tmp_path)
+    output = tmp_path / "output"
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            str(tmp_path / "*.json"),
+            "-o",
+            str(output),
+            "--output-template",
+            "{stem}-schema.rst",
+            "--title",
+            "Schema {stem}",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    rst = (output / "simple-schema.rst").read_text()
+    assert rst == expected_output(tmp_path / "simple.json", "Schema simple")
+
+
+def test_multiple_files_require_output_dir(tmp_path):
+    copy_examples(tmp_path)
+
+    result = CliRunner().invoke(
+        cli, [str(tmp_path / "simple.json"), str(tmp_path / "integer.json")]
+    )
+
+    assert result.exit_code == 2
+    assert "--output-dir" in result.output
+
+
+@pytest.mark.parametrize(
+    "options, option",
+    [
+        (["-t", "Title {x}"], "--title"),
+        (["-t", "Title {"], "--title"),
+        (["--output-template", "{foo}.rst"], "--output-template"),
+        (["--output-template", "{}.rst"], "--output-template"),
+    ],
+)
+def test_invalid_templates_are_rejected(tmp_path, options, option):
+    copy_examples(tmp_path)
+
+    result = CliRunner().invoke(
+        cli, [str(tmp_path), "-o", str(tmp_path / "output"), *options]
+    )
+
+    assert result.exit_code == 2
+    assert option in result.output
+    assert "'{stem}'" in result.output
+    assert not (tmp_path / "output").exists()
+
+
+def test_single_file_is_written_to_stdout():
+    result = CliRunner().invoke(cli, ["tests/schema-examples/simple.json"])
+
+    assert result.exit_code == 0
+    assert result.output == expected_output(
+        "tests/schema-examples/simple.json", "JSON Schema"
+    )
+
+
+def test_invalid_files_do_not_stop_the_batch(tmp_path):
+    copy_examples(tmp_path)
+    (tmp_path / "array.json").write_text("[]")
+    (tmp_path / "broken.json").write_text("{")
+    output = tmp_path / "output"
+
+    result = CliRunner().invoke(cli, [str(tmp_path), "-o", str(output)])
+
+    assert result.exit_code == 1
+    assert "Traceback" not in result.output
+    assert f"{tmp_path / 'array.json'}: The schema must be an object" in result.output
+    assert f"{tmp_path / 'broken.json'}: " in result.output
+    assert f"Converted {len(SCHEMA_EXAMPLES)} files" in result.output
+    assert "2 of 5 files could not be converted." in result.output
+    assert sorted(path.name for path in output.iterdir()) == sorted(
+        name.replace(".json", ".rst") for name in SCHEMA_EXAMPLES
+    )
+
+
+def test_single_file_must_be_an_object(tmp_path):
+    (tmp_path / "array.json").write_text("[]")
+
+    result = CliRunner().invoke(cli, [str(tmp_path / "array.json")])
+
+    assert result.exit_code == 1
+    assert "array.json: The schema must be an object" in result.output
@@ -0,0 +1,33 @@
+from benchmarks import schemas
+from benchmarks.run import SCENARIOS, compare, measure
+from benchmarks.startup import BUDGETS, check, import_time
+
+
+def test_scenarios_render():
+    factories = {
+        schemas.wide_object: {"properties": 10},
+        schemas.deep_nesting: {"depth": 5},
+        schemas.ref_fanout: {"definitions": 5, "references": 3},
+        schemas.large_enum: {"values": 10, "properties": 2},
+        schemas.any_of_union: {"variants": 3, "properties": 2},
+    }
+    for factory, options in SCENARIOS.values():
+        result = measure(factory(**factories[factory]), options, repeat=1)
+        assert result["output_size"] > 0
+        assert result["peak_memory"] > 0
+        assert result["retained_blocks"] > 0
+
+
+def test_compare_reports_regressions():
+    baseline = {"a": {"seconds": 1.0, "peak_memory": 100}}
+
+    assert compare({"a": {"seconds": 1.2, "peak_memory": 100}}, baseline, 0.25) == []
+    regressions = compare({"a": {"seconds": 1.0, "peak_memory": 200}}, baseline, 0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("a: peak_memory")
+
+
+def test_startup_within_budget():
+    times = {module: import_time(module, repeat=3) for module in BUDGETS}
+
+    assert check(times) == []
@@ -0,0 +1,68 @@
+import copy
+
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import Converter, generate
+from jsonschema_restructuredtext.cache import RenderCache
+from jsonschema_restructuredtext.main import cli
+from tests.model import Car
+
+
+def test_unchanged_document_is_served_from_cache(tmp_path):
+    cache = RenderCache(tmp_path)
+    converter = Converter(cache=cache)
+
+    first = converter.generate(Car.model_json_schema())
+    second = converter.generate(Car.model_json_schema())
+
+    assert first == second == generate(Car.model_json_schema())
+    assert cache.hits == 1
+
+
+def test_only_changed_definitions_are_rendered(tmp_path):
+    cache = RenderCache(tmp_path)
+    schema = Car.model_json_schema()
+    definitions = len(schema["$defs"])
+    Converter(cache=cache).generate(schema)
+
+    changed = copy.deepcopy(schema)
+    changed["$defs"]["Engine"]["description"] = "A changed engine."
+    cache.hits = cache.misses = 0
+    output = Converter(cache=cache).generate(changed)
+
+    assert output == generate(changed)
+    # Only the document and the Engine definition are rendered again
+    assert cache.misses == 2
+    assert cache.hits == definitions - 1
+
+
+def test_referenced_definitions_invalidate_sections(tmp_path):
+    cache = RenderCache(tmp_path)
+    schema = Car.model_json_schema()
+    Converter(cache=cache, replace_refs=True).generate(schema)
+
+    changed = copy.deepcopy(schema)
+    changed["$defs"]["CarClass"]["properties"]["doors"]["type"] = "string"
+    output = Converter(cache=cache, replace_refs=True).generate(changed)
+
+    assert output == generate(changed, replace_refs=True)
+
+
+def test_cache_size_is_bounded(tmp_path):
+    cache = RenderCache(tmp_path, max_size=10_000)
+    for i in range(100):
+        cache.set(f"{i:064x}", "x" * 1000)
+
+    size = sum(entry.stat().st_size for entry in tmp_path.glob("*/*.rst"))
+    assert size <= 10_000
+    assert cache.get(f"{99:064x}") == "x" * 1000
+
+
+def test_cli_reports_cache_hits_and_misses(tmp_path):
+    args = ["tests/schema-examples/simple.json", "--cache-dir", str(tmp_path)]
+    runner = CliRunner()
+    first = runner.invoke(cli, args)
+    second = runner.invoke(cli, args)
+
+    assert "Cache: 0 hits, 1 misses" in first.output
+    assert "Cache: 1 hits, 0 misses" in second.output
@@ -0,0 +1,46 @@
+from jsonschema_restructuredtext import Converter, generate
+from tests.model import Car
+
+
+def shared_definition_schema(references: int) -> dict:
+    """
+    Create a schema where every property references the same definition.
+    """
+    return {
+        "type": "object",
+        "properties": {
+            f"engine_{i}": {"$ref": "#/$defs/Engine"} for i in range(references)
+        },
+        "$defs": {
+            "Engine": {
+                "type": "object",
+                "description": "An engine.",
+                "properties": {"power": {"type": "integer", "minimum": 0}},
+            }
+        },
+    }
+
+
+def test_shared_definition_is_computed_once():
+    converter = Converter()
+    converter.generate(shared_definition_schema(50))
+
+    # Every property is a distinct subschema and misses once, the shared
+    # reference misses once and hits for all the other properties
+    assert converter.cache_info() == (49, 50 + 1 + 1)
+
+
+def test_cache_info_adds_up_runs():
+    converter = Converter()
+    converter.generate(shared_definition_schema(10))
+    converter.generate(shared_definition_schema(10))
+
+    assert converter.cache_info().hits == 18
+
+
+def test_cached_output_matches_generate():
+    converter = Converter()
+
+    assert converter.generate(Car.model_json_schema()) == generate(
+        Car.model_json_schema()
+    )
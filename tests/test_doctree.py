@@ -0,0 +1,99 @@
+from docutils import nodes
+from docutils.core import publish_doctree, publish_from_doctree
+from docutils.frontend import get_default_settings
+from docutils.parsers.rst import Parser
+from docutils.utils import new_document
+from docutils.writers.html5_polyglot import Writer
+
+from jsonschema_restructuredtext import (
+    compile_schema,
+    generate_nodes,
+    render_plan,
+    render_plan_nodes,
+)
+from jsonschema_restructuredtext.converter.doctree import REF_PATTERN
+from tests.model import Car
+
+SCHEMA = Car.model_json_schema()
+
+NESTED = {
+    "title": "Root",
+    "description": "The root.\n\n- a list\n- of items",
+    "additionalProperties": False,
+    "properties": {
+        "outer": {
+            "type": "object",
+            "description": "Outer *object*.",
+            "properties": {"leaf": {"type": "string", "default": "x"}},
+        },
+    },
+}
+
+
+def parsed_text(plan) -> list:
+    # Plain docutils has no :ref: role, keep the text of the references
+    rst = REF_PATTERN.sub(r"\1", render_plan(plan))
+    document = publish_doctree(rst, settings_overrides={"report_level": 5})
+    for message in list(document.findall(nodes.system_message)):
+        message.parent.remove(message)
+    return document.astext().split()
+
+
+def test_same_text_as_parsed_rst():
+    for schema in (SCHEMA, NESTED):
+        plan = compile_schema(schema)
+        (root,) = render_plan_nodes(plan)
+        assert root.astext().split() == parsed_text(plan)
+
+
+def test_structure():
+    (root,) = generate_nodes(SCHEMA)
+    assert isinstance(root, nodes.section)
+    assert root["ids"] == ["json-schema"]
+    # The definitions are subsections of the root section
+    sections = [node for node in root.children if isinstance(node, nodes.section)]
+    assert [section["ids"][0] for section in sections][:2] == ["airbag", "carclass"]
+
+    table = next(root.findall(nodes.table))
+    assert table[0].astext() == "Car"
+    assert len(list(table.findall(nodes.row))) == len(SCHEMA["properties"]) + 1
+    assert any(
+        field[0].astext() == "Possible Values" for field in root.findall(nodes.field)
+    )
+
+
+def test_references_resolve():
+    (root,) = generate_nodes(SCHEMA)
+    ids = {id for node in root.findall(nodes.Element) for id in node["ids"]}
+    refids = {
+        node["refid"] for node in root.findall(nodes.reference) if "refid" in node
+    }
+    assert refids
+    assert refids <= ids
+
+
+def test_targets_registered_in_document():
+    document = new_document("<test>", get_default_settings(Parser))
+    (root,) = generate_nodes(NESTED, document=document, title="Root")
+    assert document.nameids["root"] == "root"
+    assert document.nameids["outer"] == "outer"
+    assert document.ids["outer-leaf"].astext().startswith("outer > leaf")
+
+
+def test_block_description():
+    (root,) = generate_nodes(NESTED)
+    assert len(list(root.findall(nodes.bullet_list))) == 1
+    # In the description and its summary in the table
+    assert len(list(root.findall(nodes.emphasis))) == 2
+    # The nested table is indented below the details of its property
+    assert any(
+        isinstance(node[0], nodes.table) for node in root.findall(nodes.block_quote)
+    )
+
+
+def test_publish_html():
+    document = new_document("<test>", get_default_settings(Parser))
+    document.extend(generate_nodes(SCHEMA, document=document))
+    html = publish_from_doctree(document, writer=Writer()).decode()
+    assert 'href="#brand-country"' in html
+    assert 'id="brand-country"' in html
@@ -11,3 +11,11 @@ def test_generate():
 
     assert output == expected_output
 
+
+
+def test_missing_definition():
+    schema = {"properties": {"a": {"$ref": "#/$defs/Missing"}}}
+    output = generate(schema)
+
+    assert ":Type: Missing type" in output
+    assert ":Possible Values: Missing definition" in output
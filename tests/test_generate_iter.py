@@ -0,0 +1,27 @@
+import io
+
+from jsonschema_restructuredtext import generate, generate_iter, generate_to
+from tests.model import Car
+
+
+def test_generate_iter_matches_generate():
+    schema = Car.model_json_schema()
+    chunks = list(generate_iter(schema))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == generate(Car.model_json_schema())
+
+
+def test_generate_to_writes_document():
+    schema = Car.model_json_schema()
+    fp = io.StringIO()
+    generate_to(schema, fp, title="Car")
+
+    assert fp.getvalue() == generate(Car.model_json_schema(), title="Car")
+
+
+def test_generate_iter_strips_document():
+    output = "".join(generate_iter({"type": "object"}))
+
+    assert output.startswith("----")
+    assert output.endswith("`object`\n")
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import generate
+from jsonschema_restructuredtext.loaders import load_json, load_schema
+from jsonschema_restructuredtext.main import cli
+from tests.model import Car
+
+
+def test_json_and_yaml_files_load_the_same_schema(tmp_path):
+    schema = Car.model_json_schema()
+    (tmp_path / "car.json").write_text(json.dumps(schema))
+    (tmp_path / "car.yaml").write_text(yaml.safe_dump(schema, sort_keys=False))
+
+    assert load_schema(tmp_path / "car.json") == schema
+    assert load_schema(tmp_path / "car.yaml") == schema
+
+
+def test_json_beyond_orjson_is_loaded():
+    assert (
+        load_json(b'{"maximum": 18446744073709551616, "default": NaN}')["maximum"]
+        == 2**64
+    )
+
+
+def test_yaml_dates_are_strings(tmp_path):
+    (tmp_path / "dates.yaml").write_text(
+        "properties:\n"
+        "  day:\n"
+        "    type: string\n"
+        "    default: 2020-01-01\n"
+        "    examples: [2020-01-01, 2020-01-01T10:00:00Z]\n"
+    )
+
+    schema = load_schema(tmp_path / "dates.yaml")
+    day = schema["properties"]["day"]
+    assert day["default"] == "2020-01-01"
+    assert day["examples"] == ["2020-01-01", "2020-01-01T10:00:00Z"]
+
+    result = CliRunner().invoke(cli, [str(tmp_path / "dates.yaml")])
+    assert result.exit_code == 0, result.output
+    assert '``"2020-01-01"``' in result.output
+
+
+def test_invalid_files_raise_value_error(tmp_path):
+    (tmp_path / "empty.json").write_text("")
+    (tmp_path / "broken.yml").write_text("a: [")
+
+    with pytest.raises(ValueError):
+        load_schema(tmp_path / "empty.json")
+    with pytest.raises(ValueError):
+        load_schema(tmp_path / "broken.yml")
+
+
+def test_cli_converts_yaml(tmp_path):
+    schema = Car.model_json_schema()
+    (tmp_path / "car.yml").write_text(yaml.safe_dump(schema, sort_keys=False))
+
+    result = CliRunner().invoke(cli, [str(tmp_path / "car.yml")])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == generate(schema)
+
+    result = CliRunner().invoke(cli, [str(tmp_path), "-o", str(tmp_path / "out")])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "out" / "car.rst").read_text() == generate(schema, title="car")
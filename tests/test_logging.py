@@ -0,0 +1,120 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import loguru
+
+from jsonschema_restructuredtext import Converter, generate
+
+SCHEMA_EXAMPLES = [
+    "tests/schema-examples/nested_dicts.json",
+    "tests/schema-examples/integer.json",
+    "tests/schema-examples/simple.json",
+]
+
+
+class ReprCountingDict(dict):
+    """
+    A dict that counts how many times it has been formatted.
+    """
+
+    calls = 0
+
+    def __repr__(self):
+        ReprCountingDict.calls += 1
+        return super().__repr__()
+
+    __str__ = __repr__
+
+
+def nested_schema(depth: int) -> dict:
+    """
+    Create an object schema nested `depth` levels deep.
+    """
+    schema = {"type": "string", "description": "Leaf."}
+    for level in range(depth):
+        schema = {
+            "type": "object",
+            "description": f"Level {level}.",
+            "properties": {"child": schema, "sibling": {"type": "integer"}},
+        }
+    return schema
+
+
+def load_counting(schema: dict) -> dict:
+    return json.loads(json.dumps(schema), object_hook=ReprCountingDict)
+
+
+def test_non_debug_path_does_not_format_schemas():
+    ReprCountingDict.calls = 0
+
+    for path in SCHEMA_EXAMPLES:
+        with open(path, "r") as f:
+            generate(json.load(f, object_hook=ReprCountingDict))
+    generate(load_counting(nested_schema(100)))
+
+    assert ReprCountingDict.calls == 0
+
+
+def test_debug_path_formats_schemas():
+    ReprCountingDict.calls = 0
+
+    handler_id = loguru.logger.add(lambda message: None, level="DEBUG")
+    try:
+        generate(load_counting(nested_schema(5)), debug=True)
+    finally:
+        loguru.logger.remove(handler_id)
+
+    assert ReprCountingDict.calls > 0
+
+
+class ListLogger:
+    """
+    A logger that collects the messages it receives.
+    """
+
+    def __init__(self):
+        self.messages = []
+
+    def debug(self, message, *args):
+        self.messages.append(("DEBUG", message.format(*args)))
+
+    def warning(self, message, *args):
+        self.messages.append(("WARNING", message.format(*args)))
+
+
+def test_converter_uses_injected_logger(monkeypatch):
+    expected = generate(nested_schema(2))
+    monkeypatch.setattr(loguru.logger, "add", None)
+    monkeypatch.setattr(loguru.logger, "remove", None)
+
+    injected = ListLogger()
+    output = Converter(logger=injected).generate(nested_schema(2))
+
+    assert output == expected
+    assert ("DEBUG", "Processing child of type object") in injected.messages
+
+
+def test_repeated_and_concurrent_calls_do_not_reconfigure_logging(monkeypatch):
+    monkeypatch.setattr(loguru.logger, "add", None)
+    monkeypatch.setattr(loguru.logger, "remove", None)
+
+    schema = nested_schema(10)
+    expected = generate(schema)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(generate, [schema] * 32))
+
+    assert outputs == [expected] * 32
+
+
+def test_converter_keeps_the_sinks_of_the_application():
+    messages = []
+    handler_id = loguru.logger.add(messages.append, level="DEBUG")
+    try:
+        generate(nested_schema(2))
+        loguru.logger.debug("Application message")
+    finally:
+        loguru.logger.remove(handler_id)
+
+    assert [message.record["message"] for message in messages] == [
+        "Application message"
+    ]
@@ -0,0 +1,31 @@
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import generate
+from jsonschema_restructuredtext.main import cli
+from tests.model import Car
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"replace_refs": True}])
+def test_parallel_definitions_match_serial_output(kwargs):
+    serial = generate(Car.model_json_schema(), **kwargs)
+    parallel = generate(Car.model_json_schema(), workers=3, **kwargs)
+
+    assert parallel == serial
+
+
+def test_parallel_batch_matches_serial_batch(tmp_path):
+    for name in ["simple.json", "integer.json", "nested_dicts.json"]:
+        shutil.copy(f"tests/schema-examples/{name}", tmp_path / name)
+
+    runner = CliRunner()
+    serial = runner.invoke(cli, [str(tmp_path), "-o", str(tmp_path / "serial")])
+    parallel = runner.invoke(
+        cli, [str(tmp_path), "-o", str(tmp_path / "parallel"), "--jobs", "2"]
+    )
+
+    assert serial.exit_code == parallel.exit_code == 0
+    for output in (tmp_path / "serial").iterdir():
+        assert (tmp_path / "parallel" / output.name).read_text() == output.read_text()
@@ -0,0 +1,55 @@
+import copy
+
+from jsonschema_restructuredtext import compile_schema, generate, render_plan
+from tests.model import Car
+from tests.test_recursion import RECURSIVE_SCHEMA, nested_schema
+
+
+def test_rendered_plan_matches_generate():
+    schema = Car.model_json_schema()
+
+    for options in [{}, {"replace_refs": True}, {"suppress_undocumented": True}]:
+        plan = compile_schema(schema, **options)
+        assert render_plan(plan) == generate(schema, **options)
+        assert render_plan(plan) == render_plan(plan)
+
+    assert render_plan(compile_schema(RECURSIVE_SCHEMA, replace_refs=True)) == (
+        generate(RECURSIVE_SCHEMA, replace_refs=True)
+    )
+    deep = render_plan(compile_schema(nested_schema(1100)))
+    assert deep.count(".. csv-table::") == 1100
+
+
+def test_unchanged_sections_are_reused():
+    schema = Car.model_json_schema()
+    plan = compile_schema(schema, title="Car")
+    assert compile_schema(schema, title="Car", previous=plan) is plan
+
+    changed = copy.deepcopy(schema)
+    changed["$defs"]["Engine"]["description"] = "A changed engine."
+    new_plan = compile_schema(changed, title="Car", previous=plan)
+
+    assert render_plan(new_plan) == generate(changed, title="Car")
+    assert new_plan.changed_sections(plan) == ["Car", "Engine"]
+    reused = [
+        new.label for new, old in zip(new_plan.sections, plan.sections) if new is old
+    ]
+    assert reused == [key for key in schema["$defs"] if key != "Engine"]
+
+
+def test_deprecated_properties_are_marked():
+    schema = {"properties": {"old": {"type": "string", "deprecated": True}}}
+
+    assert ":Deprecated: Yes\n" in generate(schema)
+
+
+def test_plan_records_have_no_instance_dict():
+    plan = compile_schema(Car.model_json_schema())
+    section = plan.sections[0]
+    row = section.table.rows[0]
+
+    for record in (plan, section, section.table, row, row.detail):
+        assert not hasattr(record, "__dict__")
+
+    assert compile_schema(Car.model_json_schema()) == plan
+    assert row != row.detail
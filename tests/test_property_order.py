@@ -0,0 +1,81 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import generate
+from jsonschema_restructuredtext.main import cli
+from jsonschema_restructuredtext.utils import sort_properties
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "zeta": {"type": "string", "description": "[Deprecated] Use alpha."},
+        "beta": {"type": "string"},
+        "alpha": {"type": "string"},
+        "gamma": {"type": "string", "deprecated": True},
+        "delta": {"type": "string"},
+    },
+    "required": ["delta", "zeta"],
+}
+
+
+def row_order(rst: str) -> list:
+    return [
+        line.split("`")[1].split(" ")[0]
+        for line in rst.splitlines()
+        if line.startswith("   :ref:`")
+    ]
+
+
+@pytest.mark.parametrize(
+    ("order", "expected"),
+    [
+        ((), ["zeta", "beta", "alpha", "gamma", "delta"]),
+        (("required",), ["zeta", "delta", "beta", "alpha", "gamma"]),
+        (("deprecated",), ["beta", "alpha", "delta", "zeta", "gamma"]),
+        (("alphabetical",), ["alpha", "beta", "delta", "gamma", "zeta"]),
+        (("deprecated", "required"), ["delta", "beta", "alpha", "zeta", "gamma"]),
+        (
+            ("required", "deprecated", "alphabetical"),
+            ["delta", "zeta", "alpha", "beta", "gamma"],
+        ),
+    ],
+)
+def test_properties_are_rendered_in_order(order, expected):
+    assert row_order(generate(SCHEMA, property_order=order)) == expected
+
+
+def test_sort_properties_keeps_source_order_by_default():
+    assert list(sort_properties(SCHEMA)) == list(SCHEMA["properties"])
+    assert list(sort_properties(SCHEMA, ("deprecated", "required"))) == [
+        "delta",
+        "beta",
+        "alpha",
+        "zeta",
+        "gamma",
+    ]
+
+
+def test_unknown_property_order():
+    with pytest.raises(ValueError, match="Unknown property order: size"):
+        generate(SCHEMA, property_order=["size"])
+
+
+def test_cli_property_order(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps(SCHEMA))
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            str(schema_file),
+            "--property-order",
+            "required",
+            "--property-order",
+            "alphabetical",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert row_order(result.output) == ["delta", "zeta", "alpha", "beta", "gamma"]
@@ -0,0 +1,38 @@
+import copy
+from types import MappingProxyType
+
+from jsonschema_restructuredtext import Converter, generate
+from jsonschema_restructuredtext.cache import MemoryCache
+from tests.model import Car
+
+
+def freeze(node):
+    if isinstance(node, dict):
+        return MappingProxyType({key: freeze(value) for key, value in node.items()})
+    if isinstance(node, list):
+        return tuple(freeze(value) for value in node)
+    return node
+
+
+def test_repeated_renders_of_a_shared_schema_are_identical():
+    schema = Car.model_json_schema()
+    original = copy.deepcopy(schema)
+    converter = Converter()
+
+    first = converter.generate(schema)
+    second = converter.generate(schema)
+    resolved = generate(schema, replace_refs=True)
+
+    assert first == second == generate(original)
+    assert resolved == generate(original, replace_refs=True)
+    assert schema == original
+
+
+def test_read_only_schemas_are_rendered():
+    schema = Car.model_json_schema()
+    frozen = freeze(schema)
+
+    assert generate(frozen) == generate(schema)
+    assert generate(frozen, replace_refs=True) == generate(schema, replace_refs=True)
+    assert Converter(workers=2).generate(frozen) == generate(schema)
+    assert Converter(cache=MemoryCache()).generate(frozen) == generate(schema)
@@ -0,0 +1,52 @@
+from jsonschema_restructuredtext import generate
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"root": {"$ref": "#/$defs/Node"}},
+    "$defs": {
+        "Node": {
+            "type": "object",
+            "description": "A node of the tree.",
+            "properties": {
+                "parent": {"$ref": "#/$defs/Node"},
+                "children": {"type": "array", "items": {"$ref": "#/$defs/Node"}},
+                "next": {"anyOf": [{"$ref": "#/$defs/Node"}, {"type": "null"}]},
+            },
+        }
+    },
+}
+
+
+def nested_schema(depth: int) -> dict:
+    schema = {"type": "string"}
+    for _ in range(depth):
+        schema = {"type": "object", "properties": {"child": schema}}
+    return schema
+
+
+def test_recursive_schema_links_back_to_its_section():
+    output = generate(RECURSIVE_SCHEMA, replace_refs=True)
+
+    assert output.count(".. _node:") == 1
+    assert output.count("See :ref:`Node <node>`.") == 2
+
+
+def test_cycle_outside_definitions_links_to_the_parent_property():
+    node = {"type": "object", "properties": {"name": {"type": "string"}}}
+    node["properties"]["self"] = node
+    output = generate({"type": "object", "properties": {"node": node}})
+
+    assert "   See :ref:`node <node>`.\n" in output
+
+
+def test_deep_schema_does_not_hit_the_recursion_limit():
+    output = generate(nested_schema(1500))
+
+    assert output.count(".. csv-table::") == 1500
+
+
+def test_max_depth_limits_nested_tables():
+    output = generate(nested_schema(5), max_depth=2)
+
+    assert output.count(".. csv-table::") == 3
+    assert "the maximum depth of 2 is reached" in output
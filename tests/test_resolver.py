@@ -0,0 +1,137 @@
+import copy
+
+from jsonschema_restructuredtext.resolver import resolve_refs
+
+
+def test_shared_definitions_are_resolved_once():
+    schema = {
+        "properties": {
+            "a": {"$ref": "#/$defs/Shared"},
+            "b": {"$ref": "#/$defs/Shared", "description": "Dropped."},
+        },
+        "$defs": {"Shared": {"type": "string"}},
+    }
+    resolved = resolve_refs(schema)
+
+    assert resolved["properties"]["a"] == {"type": "string"}
+    assert resolved["properties"]["a"] is resolved["properties"]["b"]
+    assert resolved["properties"]["a"] is resolved["$defs"]["Shared"]
+
+
+def test_recursive_schema_becomes_cyclic():
+    schema = {
+        "properties": {"root": {"$ref": "#/definitions/Node"}},
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/Node"},
+                    }
+                },
+            }
+        },
+    }
+    resolved = resolve_refs(schema)
+
+    node = resolved["definitions"]["Node"]
+    assert resolved["properties"]["root"] is node
+    assert node["properties"]["children"]["items"] is node
+
+
+def test_input_is_not_modified():
+    schema = {
+        "properties": {"a": {"$ref": "#/$defs/A"}},
+        "$defs": {"A": {"type": "integer"}},
+    }
+    original = copy.deepcopy(schema)
+    resolve_refs(schema)
+
+    assert schema == original
+
+
+def test_pointers_ids_and_anchors():
+    schema = {
+        "$id": "https://example.com/root.json",
+        "properties": {
+            "escaped": {"$ref": "#/properties/a~1b/items/0"},
+            "anchor": {"$ref": "#named"},
+            "absolute": {"$ref": "https://example.com/root.json#/$defs/Int"},
+            "by_id": {"$ref": "other.json"},
+            "a/b": {"items": [{"type": "boolean"}]},
+        },
+        "$defs": {
+            "Int": {"type": "integer"},
+            "Named": {"$anchor": "named", "type": "number"},
+            "Other": {"$id": "other.json", "type": "null"},
+        },
+    }
+    properties = resolve_refs(schema)["properties"]
+
+    assert properties["escaped"] == {"type": "boolean"}
+    assert properties["anchor"]["type"] == "number"
+    assert properties["absolute"] == {"type": "integer"}
+    assert properties["by_id"]["type"] == "null"
+
+
+def test_references_in_embedded_resources():
+    schema = {
+        "$id": "https://example.com/root.json",
+        "properties": {
+            "root": {"$ref": "#/$defs/X"},
+            "embedded": {"$ref": "embedded.json"},
+        },
+        "$defs": {
+            "X": {"type": "string"},
+            "Embedded": {
+                "$id": "embedded.json",
+                "properties": {
+                    "local": {"$ref": "#/$defs/X"},
+                    "anchor": {"$ref": "#here"},
+                    "root": {"$ref": "root.json#/$defs/X"},
+                },
+                "$defs": {
+                    "X": {"type": "integer"},
+                    "Here": {"$anchor": "here", "type": "boolean"},
+                },
+            },
+        },
+    }
+    properties = resolve_refs(schema)["properties"]
+
+    assert properties["root"] == {"type": "string"}
+    embedded = properties["embedded"]["properties"]
+    assert embedded["local"] == {"type": "integer"}
+    assert embedded["anchor"]["type"] == "boolean"
+    assert embedded["root"] == {"type": "string"}
+
+
+def test_unresolvable_references_are_kept():
+    schema = {
+        "properties": {
+            "remote": {"$ref": "https://example.org/schema.json"},
+            "missing": {"$ref": "#/$defs/Missing"},
+            "loop": {"$ref": "#/$defs/Loop"},
+        },
+        "$defs": {"Loop": {"$ref": "#/$defs/Loop"}},
+    }
+    properties = resolve_refs(schema)["properties"]
+
+    assert properties["remote"] == {"$ref": "https://example.org/schema.json"}
+    assert properties["missing"] == {"$ref": "#/$defs/Missing"}
+    assert properties["loop"] == {"$ref": "#/$defs/Loop"}
+
+
+def test_long_reference_chains_are_resolved():
+    defs = {
+        f"D{i}": {"properties": {"next": {"$ref": f"#/$defs/D{i + 1}"}}}
+        for i in range(5000)
+    }
+    defs["D5000"] = {"type": "string"}
+    resolved = resolve_refs({"$ref": "#/$defs/D0", "$defs": defs})
+
+    node = resolved
+    for _ in range(5000):
+        node = node["properties"]["next"]
+    assert node == {"type": "string"}
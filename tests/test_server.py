@@ -0,0 +1,139 @@
+import http.client
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import yaml
+
+from jsonschema_restructuredtext import Converter, generate
+from jsonschema_restructuredtext.cache import MemoryCache
+from jsonschema_restructuredtext.server import RenderService, make_server
+from tests.model import Car
+
+SCHEMA = Car.model_json_schema()
+
+
+@pytest.fixture
+def service():
+    return RenderService(Converter(cache=MemoryCache(1024 * 1024)), max_schemas=2)
+
+
+@pytest.fixture
+def server(service):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+    try:
+        connection.request(method, path, body, headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("X-Cache"), response.read().decode()
+    finally:
+        connection.close()
+
+
+def test_service_renders_and_caches(service):
+    document = json.dumps(SCHEMA).encode()
+
+    assert service.render(document) == (generate(SCHEMA), False)
+    assert service.render(document) == (generate(SCHEMA), True)
+    assert service.render(document, "Car") == (generate(SCHEMA, title="Car"), False)
+    assert service.render(yaml.safe_dump(SCHEMA).encode(), yaml=True)[0] == (
+        generate(SCHEMA)
+    )
+
+    # The documents are only kept in the cache of the converter, and each
+    # entry is looked up once
+    cache = service.converter.cache
+    assert cache.misses == len(cache._entries)
+    uncached = RenderService(Converter())
+    assert uncached.render(document) == (generate(SCHEMA), False)
+    assert uncached.render(document) == (generate(SCHEMA), False)
+
+    for invalid in [b"{", b"[]"]:
+        with pytest.raises(ValueError):
+            service.render(invalid)
+
+
+def test_server_renders_concurrent_requests(server):
+    documents = []
+    for n in range(8):
+        schema = dict(SCHEMA, description=f"Version {n}.")
+        documents.append((json.dumps(schema), generate(schema, title="Car")))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(
+            executor.map(
+                lambda document: request(
+                    server, "POST", "/render?title=Car", document[0]
+                ),
+                documents * 2,
+            )
+        )
+
+    assert [(status, rst) for status, _, rst in responses] == [
+        (200, rst) for _, rst in documents * 2
+    ]
+    assert {cached for _, cached, _ in responses} <= {"hit", "miss"}
+
+
+def test_server_errors(server):
+    assert request(server, "GET", "/health")[0] == 200
+    assert request(server, "GET", "/render")[0] == 404
+    assert request(server, "POST", "/other", "{}")[0] == 404
+
+    status, _, text = request(server, "POST", "/render", "not json")
+    assert status == 400
+    assert text.startswith("Invalid schema:")
+
+
+def test_server_keeps_connection_after_error(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+    try:
+        for path, status in [("/other", 404), ("/render", 200)]:
+            connection.request("POST", path, json.dumps(SCHEMA))
+            response = connection.getresponse()
+            response.read()
+            assert response.status == status
+    finally:
+        connection.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+def test_unix_socket(service, tmp_path):
+    path = str(tmp_path / "render.sock")
+    server = make_server(service, socket_path=path)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        body = json.dumps(SCHEMA).encode()
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(path)
+            client.sendall(
+                b"POST /render HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            response = b"".join(iter(lambda: client.recv(65536), b""))
+
+        # An existing socket file is not replaced
+        with pytest.raises(OSError):
+            make_server(service, socket_path=path)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    head, _, rst = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200")
+    assert rst.decode() == generate(SCHEMA)
+    assert not (tmp_path / "render.sock").exists()
@@ -0,0 +1,120 @@
+import functools
+import json
+
+import pytest
+
+pytest.importorskip("sphinx")
+
+from sphinx.application import Sphinx  # noqa: E402
+
+from jsonschema_restructuredtext import Converter  # noqa: E402
+from jsonschema_restructuredtext.sphinxext import _options_key  # noqa: E402
+from jsonschema_restructuredtext.utils import is_documented  # noqa: E402
+from tests.model import Car  # noqa: E402
+
+SCHEMA = Car.model_json_schema()
+
+
+@pytest.fixture
+def project(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "conf.py").write_text(
+        'extensions = ["jsonschema_restructuredtext.sphinxext"]\n'
+        'jsonschema_rst_options = {"section_punctuation": ["-", "~", "^", "+"]}\n'
+    )
+    (source / "index.rst").write_text(
+        "Schemas\n=======\n\n.. jsonschema-rst:: car.json\n   :title: Car\n"
+    )
+    (source / "car.json").write_text(json.dumps(SCHEMA))
+    return tmp_path
+
+
+def build(project, parallel=0):
+    app = Sphinx(
+        str(project / "source"),
+        str(project / "source"),
+        str(project / "build"),
+        str(project / "doctrees"),
+        "html",
+        status=None,
+        warning=None,
+        parallel=parallel,
+    )
+    app.build()
+    return app
+
+
+def count_compile(monkeypatch):
+    calls = []
+    compile = Converter.compile
+
+    def counting_compile(self, *args, **kwargs):
+        calls.append(args)
+        return compile(self, *args, **kwargs)
+
+    monkeypatch.setattr(Converter, "compile", counting_compile)
+    return calls
+
+
+def test_directive_renders_schema(project):
+    app = build(project)
+    html = (project / "build" / "index.html").read_text()
+    assert "brand_country" in html
+    assert [path for path, _ in app.env.jsonschema_rst_schemas] == ["car.json"]
+
+
+def test_unchanged_schema_not_rendered_again(project, monkeypatch):
+    build(project)
+    calls = count_compile(monkeypatch)
+
+    # Only the document changed
+    index = project / "source" / "index.rst"
+    index.write_text(index.read_text() + "\nMore text.\n")
+    build(project)
+    assert calls == []
+
+    # The file was touched but its content is the same
+    schema = project / "source" / "car.json"
+    schema.write_text(schema.read_text())
+    build(project)
+    assert calls == []
+
+    schema.write_text(json.dumps({**SCHEMA, "description": "Changed"}))
+    build(project)
+    assert len(calls) == 1
+    assert "Changed" in (project / "build" / "index.html").read_text()
+
+
+def test_removed_schema_dropped(project):
+    build(project)
+    (project / "source" / "index.rst").write_text("Schemas\n=======\n")
+    app = build(project)
+    assert app.env.jsonschema_rst_schemas == {}
+
+
+def test_parallel_read(project):
+    source = project / "source"
+    for index in range(4):
+        (source / f"car{index}.rst").write_text(
+            f"Car {index}\n=====\n\n.. jsonschema-rst:: car.json\n"
+        )
+    (source / "index.rst").write_text(
+        "Schemas\n=======\n\n.. toctree::\n\n"
+        + "".join(f"   car{index}\n" for index in range(4))
+    )
+    app = build(project, parallel=2)
+    (entry,) = app.env.jsonschema_rst_schemas.values()
+    assert entry["docnames"] == {f"car{index}" for index in range(4)}
+
+
+def test_invalid_schema(project):
+    (project / "source" / "car.json").write_text("[]")
+    app = build(project)
+    assert app.env.jsonschema_rst_schemas == {}
+
+
+def test_options_key_of_predicates():
+    assert _options_key({"documented": is_documented}) is not None
+    for documented in [functools.partial(is_documented), lambda schema: True]:
+        assert _options_key({"documented": documented}) is None
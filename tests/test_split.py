@@ -0,0 +1,118 @@
+import copy
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import Converter, generate, generate_files
+from jsonschema_restructuredtext.main import cli
+from tests.model import Car
+
+
+def test_generate_files_writes_a_file_per_definition(tmp_path):
+    schema = Car.model_json_schema()
+    destination = tmp_path / "car.rst"
+
+    paths = generate_files(schema, destination, title="Car")
+
+    definitions = [tmp_path / "car" / f"{key.lower()}.rst" for key in schema["$defs"]]
+    assert paths == [destination] + definitions
+
+    document = generate(schema, title="Car")
+    for path in definitions:
+        rst = path.read_text()
+        # docutils warns about pages starting with a transition
+        assert not rst.startswith("----")
+        assert f"----\n\n{rst.strip()}" in document
+
+    index = destination.read_text()
+    assert not index.startswith("----")
+    root, toctree = index.split("\n.. toctree::\n")
+    assert document.startswith(f"----\n\n{root}")
+    assert toctree.split() == [":maxdepth:", "1"] + [
+        f"car/{path.stem}" for path in definitions
+    ]
+
+
+def test_only_changed_files_are_written(tmp_path):
+    schema = Car.model_json_schema()
+    destination = tmp_path / "car.rst"
+    converter = Converter(title="Car")
+
+    paths = converter.generate_files(schema, destination)
+    before = {path: path.stat().st_ino for path in paths}
+
+    changed = copy.deepcopy(schema)
+    changed["$defs"]["Engine"]["description"] = "A changed engine."
+    converter.generate_files(changed, destination)
+
+    rewritten = [path.name for path in paths if path.stat().st_ino != before[path]]
+    assert rewritten == ["engine.rst"]
+    assert "A changed engine." in (tmp_path / "car" / "engine.rst").read_text()
+
+
+def test_definitions_with_the_same_file_name(tmp_path):
+    schema = {
+        "properties": {"a": {"type": "string"}},
+        "$defs": {
+            "Item_Type": {"description": "First."},
+            "item type": {"description": "Second."},
+        },
+    }
+
+    paths = generate_files(schema, tmp_path / "index.rst")
+
+    assert [path.name for path in paths] == [
+        "index.rst",
+        "item-type.rst",
+        "item-type-2.rst",
+    ]
+    assert "Second." in paths[2].read_text()
+
+
+def test_definition_names_stay_in_the_directory(tmp_path):
+    names = ["../../escaped", "a/b", "a\\b", "..", ".hidden", "/absolute"]
+    schema = {"$defs": {name: {"description": name} for name in names}}
+
+    paths = generate_files(schema, tmp_path / "out" / "index.rst")
+
+    directory = tmp_path / "out" / "index"
+    assert [path.name for path in paths[1:]] == [
+        "-..-escaped.rst",
+        "a-b.rst",
+        "a-b-2.rst",
+        "definition.rst",
+        "hidden.rst",
+        "-absolute.rst",
+    ]
+    for path, name in zip(paths[1:], names):
+        assert path.parent == directory
+        assert name in path.read_text()
+    assert not (tmp_path / "escaped.rst").exists()
+
+
+def test_index_needs_a_suffix(tmp_path):
+    with pytest.raises(ValueError, match="suffix"):
+        generate_files({}, tmp_path / "index")
+
+
+def test_cli_split(tmp_path):
+    source = tmp_path / "car.json"
+    source.write_text(json.dumps(Car.model_json_schema()))
+    output = tmp_path / "output"
+
+    result = CliRunner().invoke(cli, [str(source), "-o", str(output), "--split"])
+
+    assert result.exit_code == 0, result.output
+    assert ".. toctree::" in (output / "car.rst").read_text()
+    assert (output / "car" / "engine.rst").exists()
+
+
+def test_cli_split_requires_output_dir(tmp_path):
+    source = tmp_path / "car.json"
+    source.write_text("{}")
+
+    result = CliRunner().invoke(cli, [str(source), "--split"])
+
+    assert result.exit_code == 2
+    assert "Use --output-dir with --split." in result.output
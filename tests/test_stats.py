@@ -0,0 +1,66 @@
+import json
+
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import Converter, generate
+from jsonschema_restructuredtext.main import cli
+from jsonschema_restructuredtext.stats import RenderStats
+from tests.model import Car
+
+
+def test_generate_fills_in_stats():
+    schema = Car.model_json_schema()
+    stats = RenderStats(slowest=3)
+
+    rst = generate(schema, replace_refs=True, stats=stats)
+
+    assert rst == generate(schema, replace_refs=True)
+    data = json.loads(json.dumps(stats.as_dict()))
+    assert {"resolve_refs", "render", "property_details", "sort_properties"} <= set(
+        data["phases"]
+    )
+    assert data["phases"]["property_details"]["calls"] == data["counts"]["properties"]
+    assert set(data["definitions"]) == set(schema["$defs"])
+    assert len(data["slowest_properties"]) == 3
+    seconds = [p["seconds"] for p in data["slowest_properties"]]
+    assert seconds == sorted(seconds, reverse=True)
+
+
+def test_parallel_stats_cover_every_definition():
+    schema = Car.model_json_schema()
+    serial = RenderStats()
+    parallel = RenderStats()
+
+    Converter().generate(schema, stats=serial)
+    Converter(workers=2).generate(schema, stats=parallel)
+
+    assert set(parallel.definitions) == set(schema["$defs"])
+    assert parallel.counts["properties"] == serial.counts["properties"]
+
+
+def test_cli_writes_profile(tmp_path):
+    source = tmp_path / "car.json"
+    source.write_text(json.dumps(Car.model_json_schema()))
+    profile = tmp_path / "profile.json"
+
+    result = CliRunner().invoke(cli, [str(source), "--profile", str(profile)])
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(profile.read_text())
+    assert {"load", "render", "write", "total"} <= set(data["phases"])
+
+
+def test_cli_writes_batch_profile(tmp_path):
+    source = tmp_path / "car.json"
+    source.write_text(json.dumps(Car.model_json_schema()))
+    profile = tmp_path / "profile.json"
+
+    result = CliRunner().invoke(
+        cli,
+        [str(source), "--output-dir", str(tmp_path / "out"), "--profile", str(profile)],
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(profile.read_text())
+    assert list(data["files"]) == [str(source)]
+    assert data["total"]["counts"]["properties"] > 0
@@ -0,0 +1,118 @@
+import functools
+
+import pytest
+
+from jsonschema_restructuredtext import Converter, RenderStats, compile_schema, generate
+from jsonschema_restructuredtext.cache import MemoryCache
+
+SCHEMA = {
+    "type": "object",
+    "description": "Root.",
+    "properties": {
+        "documented": {
+            "type": "object",
+            "description": "A documented object.",
+            "properties": {
+                "visible": {"type": "string", "title": "Visible"},
+                "internal": {
+                    "type": "object",
+                    "properties": {"hidden": {"type": "string", "description": "x"}},
+                },
+            },
+        },
+        "undocumented": {"type": "string"},
+        "engine": {"$ref": "#/$defs/Engine"},
+    },
+    "$defs": {
+        "Engine": {
+            "type": "object",
+            "description": "An engine.",
+            "properties": {"power": {"type": "integer"}},
+        },
+        "Wheel": {
+            "type": "object",
+            "description": "A wheel.",
+            "properties": {"size": {"type": "integer", "description": "Size."}},
+        },
+        "Internal": {"type": "object", "properties": {"a": {"type": "string"}}},
+    },
+}
+
+
+def described(schema):
+    return bool(schema.get("description"))
+
+
+def has_key(key, schema):
+    return bool(schema.get(key))
+
+
+class Described:
+    def __call__(self, schema):
+        return bool(schema.get("description"))
+
+
+def test_undocumented_properties_are_pruned():
+    stats = RenderStats()
+    rst = Converter(suppress_undocumented=True).generate(SCHEMA, stats=stats)
+
+    assert "**visible**" in rst
+    assert "**engine**" in rst
+    assert "**size**" in rst
+    for name in ["internal", "hidden", "undocumented", "power", "Internal"]:
+        assert f"**{name}**" not in rst and f".. _{name.lower()}:" not in rst
+    assert stats.counts["pruned"] == 3
+
+    assert "**undocumented**" in generate(SCHEMA)
+
+
+def test_custom_predicate():
+    rst = generate(SCHEMA, suppress_undocumented=True, documented=described)
+
+    assert "**documented**" in rst
+    assert "**visible**" not in rst
+    assert generate(SCHEMA, documented=described) == generate(SCHEMA)
+
+
+def test_custom_predicate_with_workers_and_cache():
+    expected = generate(SCHEMA, suppress_undocumented=True, documented=described)
+
+    parallel = Converter(suppress_undocumented=True, documented=described, workers=2)
+    assert parallel.generate(SCHEMA) == expected
+
+    cache = MemoryCache(1024 * 1024)
+    cached = Converter(suppress_undocumented=True, documented=described, cache=cache)
+    assert cached.generate(SCHEMA) == cached.generate(SCHEMA) == expected
+    assert cache.hits == 1
+
+    # Lambdas cannot be told apart by name, so nothing is cached for them
+    cache = MemoryCache(1024 * 1024)
+    uncached = Converter(
+        suppress_undocumented=True,
+        documented=lambda schema: bool(schema.get("description")),
+        cache=cache,
+    )
+    assert uncached.generate(SCHEMA) == uncached.generate(SCHEMA) == expected
+    assert cache.hits == cache.misses == 0
+
+
+@pytest.mark.parametrize(
+    "documented",
+    [functools.partial(has_key, "description"), Described()],
+    ids=["partial", "callable-object"],
+)
+def test_predicate_without_a_name(documented):
+    expected = generate(SCHEMA, suppress_undocumented=True, documented=described)
+
+    assert generate(SCHEMA, suppress_undocumented=True, documented=documented) == (
+        expected
+    )
+    assert compile_schema(SCHEMA, suppress_undocumented=True, documented=documented)
+
+    # Nothing is cached, as for lambdas
+    cache = MemoryCache(1024 * 1024)
+    converter = Converter(
+        suppress_undocumented=True, documented=documented, cache=cache
+    )
+    assert converter.generate(SCHEMA) == converter.generate(SCHEMA) == expected
+    assert cache.hits == cache.misses == 0
@@ -0,0 +1,57 @@
+import re
+
+import pytest
+
+from jsonschema_restructuredtext.utils import (
+    atomic_open,
+    dashify,
+    strip_inside_backticks,
+)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "no backticks",
+        "` string `",
+        "`a` or ` b` or `c `",
+        "`\t tabs \t`",
+        "`   `",
+        "unbalanced ` backtick",
+        "` across\nlines `",
+        "`one`\n` two `",
+    ],
+)
+def test_strip_inside_backticks(text):
+    expected = re.sub(r"`(.*?)`", lambda match: f"`{match.group(1).strip()}`", text)
+
+    assert strip_inside_backticks(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Car", "car"),
+        ("Root Schema", "root-schema"),
+        ("snake_case Name", "snake-case-name"),
+        ("already-dashed", "already-dashed"),
+    ],
+)
+def test_dashify(text, expected):
+    assert dashify(text) == expected
+
+
+def test_atomic_open(tmp_path):
+    path = tmp_path / "file.rst"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError), atomic_open(path) as f:
+        f.write("partial")
+        raise RuntimeError
+    assert path.read_text() == "old"
+
+    with atomic_open(path) as f:
+        f.write("new")
+    assert path.read_text() == "new"
+    assert list(tmp_path.iterdir()) == [path]
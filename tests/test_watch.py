@@ -0,0 +1,88 @@
+import json
+import os
+
+from click.testing import CliRunner
+
+from jsonschema_restructuredtext import Converter, generate
+from jsonschema_restructuredtext.cache import MemoryCache
+from jsonschema_restructuredtext.main import cli
+from jsonschema_restructuredtext.watch import Watcher
+from tests.model import Car
+
+
+def write_schema(path, schema, mtime_ns):
+    path.write_text(json.dumps(schema))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_watcher_converts_only_changed_files(tmp_path):
+    source = tmp_path / "schemas"
+    source.mkdir()
+    output = tmp_path / "output"
+    schema = Car.model_json_schema()
+    write_schema(source / "car.json", schema, 1_000_000_000)
+    write_schema(source / "other.json", schema, 1_000_000_000)
+
+    cache = MemoryCache()
+    watcher = Watcher(Converter(cache=cache), [str(source)], output)
+
+    results = watcher.poll()
+    assert [r.source.name for r in results] == ["car.json", "other.json"]
+    assert (output / "car.rst").read_text() == generate(schema, title="car")
+    assert watcher.poll() == []
+
+    # Touching a file without changing its content does not convert it again
+    write_schema(source / "other.json", schema, 2_000_000_000)
+    assert watcher.poll() == []
+
+    schema["$defs"]["Engine"]["description"] = "A changed engine."
+    write_schema(source / "car.json", schema, 2_000_000_000)
+    results = watcher.poll()
+
+    assert [r.source.name for r in results] == ["car.json"]
+    assert (output / "car.rst").read_text() == generate(schema, title="car")
+    # Only the document and the Engine definition are rendered again
+    assert results[0].cache_misses == 2
+
+
+def test_watcher_picks_up_new_files_and_survives_errors(tmp_path):
+    output = tmp_path / "output"
+    watcher = Watcher(Converter(), [str(tmp_path / "*.json")], output)
+    assert watcher.poll() == []
+
+    write_schema(tmp_path / "broken.json", {}, 1_000_000_000)
+    (tmp_path / "broken.json").write_text("{")
+    assert watcher.poll() == []
+    assert not (output / "broken.rst").exists()
+
+    write_schema(tmp_path / "broken.json", {"title": "Fixed"}, 2_000_000_000)
+    assert [r.source.name for r in watcher.poll()] == ["broken.json"]
+    assert (output / "broken.rst").read_text() == generate(
+        {"title": "Fixed"}, title="broken"
+    )
+
+
+def test_watcher_survives_conversion_errors(tmp_path):
+    output = tmp_path / "output"
+    watcher = Watcher(Converter(), [str(tmp_path / "*.json")], output)
+
+    dangling = {"properties": {"a": {"$ref": "#/$defs/Missing"}}}
+    write_schema(tmp_path / "dangling.json", dangling, 1_000_000_000)
+    write_schema(tmp_path / "array.json", [], 1_000_000_000)
+    write_schema(tmp_path / "car.json", Car.model_json_schema(), 1_000_000_000)
+    results = watcher.poll()
+    assert [r.source.name for r in results] == ["car.json", "dangling.json"]
+    assert "Missing definition" in (output / "dangling.rst").read_text()
+    assert not (output / "array.rst").exists()
+
+    # Failed files are only tried again once they change
+    assert watcher.poll() == []
+    write_schema(tmp_path / "array.json", {"title": "Fixed"}, 2_000_000_000)
+    assert [r.source.name for r in watcher.poll()] == ["array.json"]
+
+
+def test_watch_requires_output_dir(tmp_path):
+    result = CliRunner().invoke(cli, [str(tmp_path), "--watch"])
+
+    assert result.exit_code != 0
+    assert "--output-dir" in result.output